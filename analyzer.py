@@ -6,12 +6,16 @@ bloats the HTML document itself (inline scripts, styles, SVGs,
 base64 data URIs, JSON-LD blocks, and large DOM subtrees).
 """
 
+import concurrent.futures
+import functools
+import os
 import re
-import json
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
-from bs4 import BeautifulSoup, Comment, Tag
+import orjson
+from lxml import etree
+from lxml import html as lxml_html
 
 from classifiers import (
     classify_data_uri,
@@ -34,7 +38,7 @@ MIN_DOM_SUBTREE_DESCENDANTS = 100
 DATA_URI_RE = re.compile(r'data:[^"\')\s]+', re.I)
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """A single heavy-element finding from page analysis."""
 
@@ -47,11 +51,24 @@ class Finding:
     priority: str  # "primary" or "secondary"
     pages_found_on: list[str] = field(default_factory=list)
     scope: str = "page-specific"  # "site-wide", "template-wide", etc.
+    # Either the snippet string or a zero-arg callable producing it;
+    # deferred snippets are materialized (and cached back) on first
+    # serialization, so unreported findings never pay the decode cost.
     searchable_snippet: str = ""
     is_subcomponent: bool = False
+    # Render cache: newline-joined pages_found_on, filled in by
+    # aggregation so every table that shows the page list reuses one
+    # string instead of re-joining per render.
+    pages_joined: str = ""
+    # Precomputed (priority-rank, -size) tuple set by aggregation so
+    # the final sort can use a C-level attrgetter key.
+    _sort_key: tuple = ()
 
     def to_dict(self) -> dict:
         """Convert to a JSON-serializable dictionary."""
+        snippet = self.searchable_snippet
+        if callable(snippet):
+            snippet = self.searchable_snippet = snippet()
         return {
             "element_type": self.element_type,
             "element_identifier": self.element_identifier,
@@ -62,20 +79,23 @@ class Finding:
             "priority": self.priority,
             "pages_found_on": self.pages_found_on,
             "scope": self.scope,
-            "searchable_snippet": self.searchable_snippet,
+            "searchable_snippet": snippet,
         }
 
 def _extract_snippet(item, max_length=150) -> str:
-    """Extract a searchable snippet from a Tag, Comment, or string."""
-    text = str(item)
-    # Remove newlines and collapse spaces for a cleaner JSON snippet
-    text = re.sub(r'\s+', ' ', text).strip()
+    """Extract a searchable snippet from a string of markup or code."""
+    # Bound the input so we never scan more than a few hundred bytes
+    # of a large blob.
+    text = str(item)[:max_length * 4]
+    # Remove newlines and collapse spaces for a cleaner JSON snippet;
+    # split/join does the whitespace collapse in one C-level pass.
+    text = ' '.join(text.split())
     if len(text) > max_length:
         return text[:max_length] + "..."
     return text
 
 
-@dataclass
+@dataclass(slots=True)
 class PageAnalysis:
     """Complete analysis results for a single page."""
 
@@ -107,17 +127,112 @@ class PageAnalysis:
             "findings": [f.to_dict() for f in self.findings],
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize directly to JSON bytes.
+
+        orjson encodes the nested Finding objects via _json_default as
+        it goes, so no intermediate list of dicts is materialized.
+        """
+        return orjson.dumps(
+            self,
+            default=_json_default,
+            # Route dataclasses through the hook instead of orjson's
+            # field-by-field dataclass encoding.
+            option=orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+
+
+def _json_default(o):
+    """orjson default hook for encoding analysis objects."""
+    if isinstance(o, Finding):
+        return o.to_dict()
+    if isinstance(o, PageAnalysis):
+        return {
+            "url": o.url,
+            "total_html_bytes": o.total_html_bytes,
+            "total_html_kb": round(o.total_html_bytes / 1024, 1),
+            "total_flagged_bytes": o.total_flagged_bytes,
+            "flagged_percent": round(o.flagged_percent, 1),
+            "findings_count": len(o.findings),
+            # Encoded lazily through this same hook
+            "findings": o.findings,
+        }
+    raise TypeError(
+        f"Object of type {type(o).__name__} is not JSON serializable"
+    )
+
+
+@dataclass(slots=True)
+class _AnalysisContext:
+    """Per-page state shared by the single-pass tag handlers."""
+
+    url: str
+    total_bytes: int
+    findings: list[Finding] = field(default_factory=list)
+    images: list = field(default_factory=list)
+    comments: list = field(default_factory=list)
+    seen_data_uris: set = field(default_factory=set)
+    serialize_cache: dict = field(default_factory=dict)
+    pct_factor: float = 0.0
+
+    def __post_init__(self) -> None:
+        # One division per page; every finding is then a single multiply.
+        if self.total_bytes:
+            self.pct_factor = 100.0 / self.total_bytes
+
+    def percent(self, size: int) -> float:
+        """Compute a size as a percentage of the total page size."""
+        return size * self.pct_factor
+
+    def element_bytes(self, element) -> bytes:
+        """Serialize an element to HTML bytes, memoized per node.
+
+        Overlapping analyzers (size checks and snippet extraction)
+        hit the same nodes, so each subtree is serialized at most once.
+        """
+        data = self.serialize_cache.get(id(element))
+        if data is None:
+            data = etree.tostring(element, method="html", with_tail=False)
+            self.serialize_cache[id(element)] = data
+        return data
+
+    def element_size(self, element) -> int:
+        """Get the byte size of an element's serialized HTML."""
+        return len(self.element_bytes(element))
+
+    def snippet(self, element, max_length=150):
+        """Deferred snippet for an element, reusing the cached bytes.
+
+        Returns a picklable zero-arg callable; Finding.to_dict calls it
+        when (and only when) the finding is serialized.
+        """
+        return functools.partial(
+            _snippet_from_bytes, self.element_bytes(element), max_length
+        )
+
 
-def _element_byte_size(element: Tag) -> int:
-    """Get the byte size of an element's serialized HTML."""
-    return len(str(element).encode("utf-8"))
+def _snippet_from_bytes(data: bytes, max_length: int = 150) -> str:
+    """Decode serialized element bytes and extract a snippet."""
+    return _extract_snippet(data.decode("utf-8", "replace"), max_length)
 
 
 def _content_byte_size(text: str) -> int:
-    """Get the byte size of a text string."""
+    """Get the UTF-8 byte size of a text string.
+
+    str.isascii() is an O(1) flag check on CPython, and for ASCII text
+    (most markup and script content) the character count is the byte
+    count — no throwaway bytes object needed.
+    """
+    if text.isascii():
+        return len(text)
     return len(text.encode("utf-8"))
 
 
+def _class_str(element) -> str:
+    """Get an element's class attribute as a plain string."""
+    return element.get("class") or ""
+
+
 def _analyze_json_bloat(
     json_data: dict,
     total_bytes: int,
@@ -125,605 +240,508 @@ def _analyze_json_bloat(
     parent_identifier: str,
     min_node_bytes: int = 5000,
 ) -> list[Finding]:
-    """Find the largest nodes within a JSON payload."""
-    findings = []
-    
-    for key, value in json_data.items():
+    """Find the largest nodes within a JSON payload.
+
+    Node sizes are computed bottom-up from child sizes (matching
+    orjson's compact output exactly), so each value is serialized at
+    most once instead of being re-serialized at every nesting level.
+    """
+    findings: list[Finding] = []
+    sizes: dict[int, int] = {}
+    pct_factor = 100.0 / total_bytes if total_bytes else 0.0
+
+    def _measure(obj) -> int:
+        """Get the serialized byte size of a value, memoized per node."""
+        if isinstance(obj, (dict, list)):
+            cached = sizes.get(id(obj))
+            if cached is not None:
+                return cached
+            if isinstance(obj, dict):
+                # {"k":v,...} — braces, commas, and a colon per item
+                size = 2 + max(len(obj) - 1, 0)
+                for k, v in obj.items():
+                    size += len(orjson.dumps(k)) + 1 + _measure(v)
+            else:
+                size = 2 + max(len(obj) - 1, 0) + sum(
+                    _measure(v) for v in obj
+                )
+            sizes[id(obj)] = size
+            return size
         try:
-            node_str = json.dumps(value)
-            node_size = len(node_str.encode("utf-8"))
-            
+            return len(orjson.dumps(obj))
+        except (orjson.JSONEncodeError, TypeError):
+            return 0
+
+    def _emit(node: dict, identifier: str) -> None:
+        for key, value in node.items():
+            node_size = _measure(value)
+
             if node_size >= min_node_bytes:
                 # Add finding for this node
+                try:
+                    snippet = _extract_snippet(
+                        orjson.dumps(value)[:200].decode("utf-8", "replace"),
+                        max_length=100,
+                    )
+                except (orjson.JSONEncodeError, TypeError):
+                    snippet = ""
                 findings.append(Finding(
                     element_type="json-node",
-                    element_identifier=f"{parent_identifier} -> [\"{key}\"]",
+                    element_identifier=f"{identifier} -> [\"{key}\"]",
                     description=f"Large JSON node ('{key}') in script payload",
                     visibility="backend",
                     size_bytes=node_size,
-                    percent_of_page=(node_size / total_bytes * 100) if total_bytes else 0,
+                    percent_of_page=node_size * pct_factor,
                     priority="primary",
                     pages_found_on=[url],
-                    searchable_snippet=f"\"{key}\": " + _extract_snippet(node_str, max_length=100),
+                    searchable_snippet=f"\"{key}\": " + snippet,
                     is_subcomponent=True,
                 ))
-                
+
                 # Recurse if children are also large dicts
                 if isinstance(value, dict) and node_size >= min_node_bytes * 2:
-                    findings.extend(_analyze_json_bloat(
-                        value,
-                        total_bytes,
-                        url,
-                        parent_identifier=f"{parent_identifier} -> [\"{key}\"]",
-                        min_node_bytes=min_node_bytes
-                    ))
-        except (TypeError, ValueError):
-            continue
-            
+                    _emit(value, f"{identifier} -> [\"{key}\"]")
+
+    _emit(json_data, parent_identifier)
     return findings
 
 
-def _analyze_inline_scripts(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Find and measure inline <script> tags (no src attribute).
+def _handle_script(script, ctx: _AnalysisContext) -> None:
+    """Handle a <script> tag: inline, JSON-LD, or external."""
+    src = script.get("src")
+    if src:
+        # External script (secondary priority)
+        is_async = script.get("async") is not None
+        is_defer = script.get("defer") is not None
 
-    This covers regular inline scripts and JSON-LD / data blocks.
-    """
-    findings = []
+        description, visibility = classify_external_resource(src)
+        loading = []
+        if is_async:
+            loading.append("async")
+        if is_defer:
+            loading.append("defer")
+        if loading:
+            description += f" ({', '.join(loading)})"
 
-    for script in soup.find_all("script"):
-        src = script.get("src")
-        if src:
-            continue  # External script — handled separately
+        # The tag itself is small in the HTML (just the <script> tag)
+        tag_size = ctx.element_size(script)
 
-        content = script.get_text()
-        if not content or not content.strip():
-            continue
+        identifier = get_element_identifier("script", src=src)
+        ctx.findings.append(Finding(
+            element_type="external-script",
+            element_identifier=identifier,
+            description=description,
+            visibility=visibility,
+            size_bytes=tag_size,
+            percent_of_page=ctx.percent(tag_size),
+            priority="secondary",
+            pages_found_on=[ctx.url],
+            searchable_snippet=ctx.snippet(script),
+        ))
+        return
 
-        size = _content_byte_size(content)
-        script_type = script.get("type", "").lower()
-
-        # JSON-LD structured data
-        if "ld+json" in script_type or "json" in script_type:
-            if size >= MIN_JSON_LD_BYTES:
-                description, visibility = classify_json_ld(content)
-                identifier = get_element_identifier(
-                    "script",
-                    type_attr=script.get("type"),
-                    id_attr=script.get("id"),
-                )
-                findings.append(Finding(
-                    element_type="json-ld",
-                    element_identifier=identifier,
-                    description=description,
-                    visibility=visibility,
-                    size_bytes=size,
-                    percent_of_page=(size / total_bytes * 100)
-                    if total_bytes
-                    else 0,
-                    priority="primary",
-                    pages_found_on=[url],
-                    searchable_snippet=_extract_snippet(script),
-                ))
+    content = script.text_content()
+    if not content or not content.strip():
+        return
 
-                # Also analyze the JSON for large internal nodes
-                try:
-                    json_data = json.loads(content)
-                    if isinstance(json_data, dict):
-                        findings.extend(_analyze_json_bloat(
-                            json_data,
-                            total_bytes,
-                            url,
-                            parent_identifier=identifier
-                        ))
-                except (json.JSONDecodeError, TypeError):
-                    pass
-        elif size >= MIN_INLINE_SCRIPT_BYTES:
-            description, visibility = classify_inline_content(content)
+    size = _content_byte_size(content)
+    script_type = (script.get("type") or "").lower()
+
+    # JSON-LD structured data
+    if "ld+json" in script_type or "json" in script_type:
+        if size >= MIN_JSON_LD_BYTES:
+            description, visibility = classify_json_ld(content)
             identifier = get_element_identifier(
                 "script",
                 type_attr=script.get("type"),
                 id_attr=script.get("id"),
             )
-            findings.append(Finding(
-                element_type="inline-script",
+            ctx.findings.append(Finding(
+                element_type="json-ld",
                 element_identifier=identifier,
                 description=description,
                 visibility=visibility,
                 size_bytes=size,
-                percent_of_page=(size / total_bytes * 100)
-                if total_bytes
-                else 0,
+                percent_of_page=ctx.percent(size),
                 priority="primary",
-                pages_found_on=[url],
-                searchable_snippet=_extract_snippet(script),
+                pages_found_on=[ctx.url],
+                searchable_snippet=ctx.snippet(script),
             ))
-            
-            # Analyze hydration payloads for bloat
-            if "React Router" in description or "Hydrogen" in description or "Next.js" in description:
-                try:
-                    # Look for streamController.enqueue("...") or similar patterns passing a string
-                    match = re.search(r'enqueue\((["\'])(.*?)\1\)', content, re.DOTALL)
-                    if match:
-                        payload_str = match.group(2)
-                        decoded_payload = payload_str.encode().decode('unicode_escape')
-                        json_start = re.search(r'[\[\{]', decoded_payload)
-                        if json_start:
-                            json_str = decoded_payload[json_start.start():]
-                            json_data = json.loads(json_str)
-                            if isinstance(json_data, (dict, list)):
-                                # If it's a list, wrap it in a pseudo-dict to fit our recursive analyzer
-                                if isinstance(json_data, list):
-                                    json_data = {"__hydration_array__": json_data}
-                                    
-                                findings.extend(_analyze_json_bloat(
-                                    json_data,
-                                    total_bytes,
-                                    url,
-                                    parent_identifier=identifier
-                                ))
-                except Exception:
-                    pass
-
-    return findings
-
-
-def _analyze_inline_styles(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Find and measure inline <style> tags."""
-    findings = []
-
-    for style in soup.find_all("style"):
-        content = style.get_text()
-        if not content or not content.strip():
-            continue
-
-        size = _content_byte_size(content)
-        if size < MIN_INLINE_STYLE_BYTES:
-            continue
-
-        identifier = get_element_identifier(
-            "style",
-            id_attr=style.get("id"),
-        )
-        findings.append(Finding(
-            element_type="inline-style",
-            element_identifier=identifier,
-            description="Inline CSS stylesheet",
-            visibility="user-visible",
-            size_bytes=size,
-            percent_of_page=(size / total_bytes * 100)
-            if total_bytes
-            else 0,
-            priority="primary",
-            pages_found_on=[url],
-            searchable_snippet=_extract_snippet(style),
-        ))
-
-    return findings
-
-
-def _analyze_inline_svgs(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Find and measure inline <svg> elements."""
-    findings = []
-
-    for svg in soup.find_all("svg"):
-        size = _element_byte_size(svg)
-        if size < MIN_SVG_BYTES:
-            continue
 
-        description, visibility = classify_svg(svg)
+            # Also analyze the JSON for large internal nodes
+            try:
+                json_data = orjson.loads(content)
+                if isinstance(json_data, dict):
+                    ctx.findings.extend(_analyze_json_bloat(
+                        json_data,
+                        ctx.total_bytes,
+                        ctx.url,
+                        parent_identifier=identifier
+                    ))
+            except (orjson.JSONDecodeError, TypeError):
+                pass
+    elif size >= MIN_INLINE_SCRIPT_BYTES:
+        description, visibility = classify_inline_content(content)
         identifier = get_element_identifier(
-            "svg",
-            id_attr=svg.get("id"),
-            class_attr=" ".join(svg.get("class", [])),
+            "script",
+            type_attr=script.get("type"),
+            id_attr=script.get("id"),
         )
-        findings.append(Finding(
-            element_type="inline-svg",
+        ctx.findings.append(Finding(
+            element_type="inline-script",
             element_identifier=identifier,
             description=description,
             visibility=visibility,
             size_bytes=size,
-            percent_of_page=(size / total_bytes * 100)
-            if total_bytes
-            else 0,
+            percent_of_page=ctx.percent(size),
             priority="primary",
-            pages_found_on=[url],
-            searchable_snippet=_extract_snippet(svg),
+            pages_found_on=[ctx.url],
+            searchable_snippet=ctx.snippet(script),
         ))
 
-    return findings
+        # Analyze hydration payloads for bloat
+        if "React Router" in description or "Hydrogen" in description or "Next.js" in description:
+            try:
+                # Look for streamController.enqueue("...") or similar patterns passing a string
+                match = re.search(r'enqueue\((["\'])(.*?)\1\)', content, re.DOTALL)
+                if match:
+                    payload_str = match.group(2)
+                    decoded_payload = payload_str.encode().decode('unicode_escape')
+                    json_start = re.search(r'[\[\{]', decoded_payload)
+                    if json_start:
+                        json_str = decoded_payload[json_start.start():]
+                        json_data = orjson.loads(json_str)
+                        if isinstance(json_data, (dict, list)):
+                            # If it's a list, wrap it in a pseudo-dict to fit our recursive analyzer
+                            if isinstance(json_data, list):
+                                json_data = {"__hydration_array__": json_data}
+
+                            ctx.findings.extend(_analyze_json_bloat(
+                                json_data,
+                                ctx.total_bytes,
+                                ctx.url,
+                                parent_identifier=identifier
+                            ))
+            except Exception:
+                pass
+
+
+def _handle_style(style, ctx: _AnalysisContext) -> None:
+    """Handle an inline <style> tag."""
+    content = style.text_content()
+    if not content or not content.strip():
+        return
+
+    size = _content_byte_size(content)
+    if size < MIN_INLINE_STYLE_BYTES:
+        return
+
+    identifier = get_element_identifier(
+        "style",
+        id_attr=style.get("id"),
+    )
+    ctx.findings.append(Finding(
+        element_type="inline-style",
+        element_identifier=identifier,
+        description="Inline CSS stylesheet",
+        visibility="user-visible",
+        size_bytes=size,
+        percent_of_page=ctx.percent(size),
+        priority="primary",
+        pages_found_on=[ctx.url],
+        searchable_snippet=ctx.snippet(style),
+    ))
 
 
-def _analyze_data_uris(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Find and measure base64 data URIs in element attributes."""
-    findings = []
-    seen_uris = set()
-
-    for tag in soup.find_all(True):
-        for attr_name, attr_value in tag.attrs.items():
-            if isinstance(attr_value, list):
-                attr_value = " ".join(attr_value)
-            if not isinstance(attr_value, str):
-                continue
+def _handle_svg(svg, ctx: _AnalysisContext) -> None:
+    """Handle an inline <svg> element."""
+    size = ctx.element_size(svg)
+    if size < MIN_SVG_BYTES:
+        return
 
-            for match in DATA_URI_RE.finditer(attr_value):
-                data_uri = match.group(0)
-                # Use truncated URI as dedup key
-                uri_key = data_uri[:200]
-                if uri_key in seen_uris:
-                    continue
-                seen_uris.add(uri_key)
-
-                size = _content_byte_size(data_uri)
-                if size < MIN_DATA_URI_BYTES:
-                    continue
-
-                description, visibility = classify_data_uri(data_uri)
-                identifier = get_element_identifier(
-                    tag.name,
-                    id_attr=tag.get("id"),
-                    class_attr=" ".join(tag.get("class", []))
-                    if isinstance(tag.get("class"), list)
-                    else tag.get("class"),
-                )
-                findings.append(Finding(
-                    element_type="data-uri",
-                    element_identifier=f"{identifier} [{attr_name}]",
-                    description=description,
-                    visibility=visibility,
-                    size_bytes=size,
-                    percent_of_page=(size / total_bytes * 100)
-                    if total_bytes
-                    else 0,
-                    priority="primary",
-                    pages_found_on=[url],
-                    searchable_snippet=_extract_snippet(tag),
-                ))
+    description, visibility = classify_svg(svg)
+    identifier = get_element_identifier(
+        "svg",
+        id_attr=svg.get("id"),
+        class_attr=_class_str(svg),
+    )
+    ctx.findings.append(Finding(
+        element_type="inline-svg",
+        element_identifier=identifier,
+        description=description,
+        visibility=visibility,
+        size_bytes=size,
+        percent_of_page=ctx.percent(size),
+        priority="primary",
+        pages_found_on=[ctx.url],
+        searchable_snippet=ctx.snippet(svg),
+    ))
 
-    return findings
 
+def _handle_noscript(ns, ctx: _AnalysisContext) -> None:
+    """Handle a <noscript> block."""
+    min_noscript_bytes = 2000
 
-def _analyze_large_dom_subtrees(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Find DOM elements with an unusually large number of descendants."""
-    findings = []
-    already_flagged = set()
+    size = ctx.element_size(ns)
+    if size < min_noscript_bytes:
+        return
 
-    body = soup.find("body")
-    if not body:
-        return findings
+    identifier = get_element_identifier(
+        "noscript",
+        id_attr=ns.get("id"),
+        class_attr=_class_str(ns),
+    )
+    ctx.findings.append(Finding(
+        element_type="noscript-fallback",
+        element_identifier=identifier,
+        description="Large <noscript> fallback content",
+        visibility="backend",
+        size_bytes=size,
+        percent_of_page=ctx.percent(size),
+        priority="primary",
+        pages_found_on=[ctx.url],
+        searchable_snippet=ctx.snippet(ns),
+    ))
 
-    for element in body.find_all(True):
-        # Skip elements nested inside already-flagged parents
-        if any(parent_id in already_flagged for parent_id in [
-            id(p) for p in element.parents if isinstance(p, Tag)
-        ]):
-            continue
 
-        descendants = list(element.find_all(True))
-        num_descendants = len(descendants)
+def _handle_iframe(iframe, ctx: _AnalysisContext) -> None:
+    """Handle an <iframe> tag (secondary priority)."""
+    src = iframe.get("src") or ""
+    description, visibility = classify_external_resource(src)
+    if description == "Unknown third-party resource":
+        description = "Embedded iframe"
+        visibility = "user-visible"
+
+    tag_size = ctx.element_size(iframe)
+    identifier = get_element_identifier("iframe", src=src)
+
+    ctx.findings.append(Finding(
+        element_type="iframe",
+        element_identifier=identifier,
+        description=description,
+        visibility=visibility,
+        size_bytes=tag_size,
+        percent_of_page=ctx.percent(tag_size),
+        priority="secondary",
+        pages_found_on=[ctx.url],
+        searchable_snippet=ctx.snippet(iframe),
+    ))
 
-        if num_descendants < MIN_DOM_SUBTREE_DESCENDANTS:
-            continue
 
-        size = _element_byte_size(element)
-        # Only flag if it's a significant chunk of the total page
-        if total_bytes > 0 and (size / total_bytes * 100) < 1.0:
-            continue
+def _handle_link(link, ctx: _AnalysisContext) -> None:
+    """Handle a stylesheet <link> tag (secondary priority)."""
+    rel = (link.get("rel") or "").split()
+    if "stylesheet" not in rel:
+        return
 
-        already_flagged.add(id(element))
+    href = link.get("href") or ""
+    if not href:
+        return
 
-        tag_name = element.name
-        identifier = get_element_identifier(
-            tag_name,
-            id_attr=element.get("id"),
-            class_attr=" ".join(element.get("class", []))
-            if isinstance(element.get("class"), list)
-            else element.get("class"),
-        )
-        findings.append(Finding(
-            element_type="large-dom-subtree",
-            element_identifier=identifier,
-            description=(
-                f"Large DOM subtree with {num_descendants} "
-                f"descendant elements"
-            ),
-            visibility="user-visible",
-            size_bytes=size,
-            percent_of_page=(size / total_bytes * 100)
-            if total_bytes
-            else 0,
-            priority="primary",
-            pages_found_on=[url],
-            searchable_snippet=_extract_snippet(element),
-        ))
+    description, visibility = classify_external_resource(href)
+    if description == "Unknown third-party resource":
+        description = "External stylesheet"
+        visibility = "user-visible"
 
-    return findings
+    tag_size = ctx.element_size(link)
 
+    identifier = get_element_identifier("link", src=href)
+    ctx.findings.append(Finding(
+        element_type="external-stylesheet",
+        element_identifier=identifier,
+        description=description,
+        visibility=visibility,
+        size_bytes=tag_size,
+        percent_of_page=ctx.percent(tag_size),
+        priority="secondary",
+        pages_found_on=[ctx.url],
+        searchable_snippet=ctx.snippet(link),
+    ))
 
-def _analyze_hidden_content(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Find large hidden content blocks (display:none, hidden attr)."""
-    findings = []
-    min_hidden_bytes = 2000  # Only flag hidden blocks > 2KB
 
-    for element in soup.find_all(True):
-        style = element.get("style", "")
-        hidden_attr = element.get("hidden") is not None
+def _collect_img(img, ctx: _AnalysisContext) -> None:
+    """Collect an <img> tag for the aggregate images finding."""
+    ctx.images.append(img)
+
+
+# Dispatch table: tag name -> handler called once per matching element
+# during the single shared traversal in analyze_page.
+_TAG_HANDLERS = {
+    "script": _handle_script,
+    "style": _handle_style,
+    "svg": _handle_svg,
+    "noscript": _handle_noscript,
+    "iframe": _handle_iframe,
+    "img": _collect_img,
+    "link": _handle_link,
+}
+
+# Raw-markup markers used to prescreen the handler table: a tag whose
+# opening marker never appears in the source can't yield any findings,
+# so its handler is dropped from the per-page dispatch dict entirely.
+_TAG_MARKERS = {
+    "script": "<script",
+    "style": "<style",
+    "svg": "<svg",
+    "noscript": "<noscript",
+    "iframe": "<iframe",
+    "img": "<img",
+    "link": "<link",
+}
+
+
+# Attribute nodes containing "data:", selected inside libxml2 so
+# Python never loops over the attributes of unaffected elements. The
+# translate() folds D/A/T to lowercase first so DATA:/Data: URIs match
+# too, mirroring DATA_URI_RE's re.I.
+_DATA_URI_ATTR_XPATH = etree.XPath(
+    '//@*[contains(translate(., "DAT", "dat"), "data:")]'
+)
 
-        is_hidden = (
-            hidden_attr
-            or "display:none" in style.replace(" ", "").lower()
-            or "display: none" in style.lower()
-        )
 
-        if not is_hidden:
-            continue
+def _analyze_data_uris(tree, ctx: _AnalysisContext) -> None:
+    """Find large base64 data URIs embedded in attribute values.
 
-        size = _element_byte_size(element)
-        if size < min_hidden_bytes:
-            continue
+    The XPath returns only the matching attribute values as "smart
+    strings" carrying their owner element and attribute name.
+    """
+    for attr_value in _DATA_URI_ATTR_XPATH(tree):
+        for match in DATA_URI_RE.finditer(attr_value):
+            data_uri = match.group(0)
+            # Use truncated URI as dedup key
+            uri_key = data_uri[:200]
+            if uri_key in ctx.seen_data_uris:
+                continue
+            ctx.seen_data_uris.add(uri_key)
 
-        identifier = get_element_identifier(
-            element.name,
-            id_attr=element.get("id"),
-            class_attr=" ".join(element.get("class", []))
-            if isinstance(element.get("class"), list)
-            else element.get("class"),
-        )
-        findings.append(Finding(
-            element_type="hidden-content",
-            element_identifier=identifier,
-            description="Hidden content block (display:none or hidden)",
-            visibility="backend",
-            size_bytes=size,
-            percent_of_page=(size / total_bytes * 100)
-            if total_bytes
-            else 0,
-            priority="primary",
-            pages_found_on=[url],
-            searchable_snippet=_extract_snippet(element),
-        ))
+            size = _content_byte_size(data_uri)
+            if size < MIN_DATA_URI_BYTES:
+                continue
 
-    return findings
+            element = attr_value.getparent()
+            description, visibility = classify_data_uri(data_uri)
+            identifier = get_element_identifier(
+                element.tag,
+                id_attr=element.get("id"),
+                class_attr=_class_str(element),
+            )
+            ctx.findings.append(Finding(
+                element_type="data-uri",
+                element_identifier=f"{identifier} [{attr_value.attrname}]",
+                description=description,
+                visibility=visibility,
+                size_bytes=size,
+                percent_of_page=ctx.percent(size),
+                priority="primary",
+                pages_found_on=[ctx.url],
+                searchable_snippet=ctx.snippet(element),
+            ))
 
 
-def _analyze_html_comments(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Find large HTML comments."""
-    findings = []
+def _finalize_comments(ctx: _AnalysisContext) -> None:
+    """Emit the aggregate HTML-comments finding, if large enough."""
     min_comment_bytes = 1000
 
-    comments = soup.find_all(string=lambda text: isinstance(text, Comment))
     total_comment_size = 0
-
-    for comment in comments:
-        total_comment_size += _content_byte_size(str(comment))
+    for comment in ctx.comments:
+        total_comment_size += _content_byte_size(comment.text or "")
 
     if total_comment_size >= min_comment_bytes:
-        findings.append(Finding(
+        ctx.findings.append(Finding(
             element_type="html-comments",
-            element_identifier=f"<!-- {len(comments)} comments -->",
+            element_identifier=f"<!-- {len(ctx.comments)} comments -->",
             description=(
-                f"{len(comments)} HTML comments totaling "
+                f"{len(ctx.comments)} HTML comments totaling "
                 f"{total_comment_size:,} bytes"
             ),
             visibility="backend",
             size_bytes=total_comment_size,
-            percent_of_page=(total_comment_size / total_bytes * 100)
-            if total_bytes
-            else 0,
+            percent_of_page=ctx.percent(total_comment_size),
             priority="primary",
-            pages_found_on=[url],
-            searchable_snippet=_extract_snippet(comments[0] if comments else ""),
+            pages_found_on=[ctx.url],
+            searchable_snippet=_extract_snippet(
+                ctx.comments[0].text or "" if ctx.comments else ""
+            ),
         ))
 
-    return findings
 
-
-def _analyze_noscript_blocks(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Find large <noscript> blocks."""
-    findings = []
-    min_noscript_bytes = 2000
-
-    for ns in soup.find_all("noscript"):
-        size = _element_byte_size(ns)
-        if size < min_noscript_bytes:
-            continue
-
-        identifier = get_element_identifier(
-            "noscript",
-            id_attr=ns.get("id"),
-            class_attr=" ".join(ns.get("class", []))
-            if isinstance(ns.get("class"), list)
-            else ns.get("class"),
-        )
-        findings.append(Finding(
-            element_type="noscript-fallback",
-            element_identifier=identifier,
-            description="Large <noscript> fallback content",
-            visibility="backend",
-            size_bytes=size,
-            percent_of_page=(size / total_bytes * 100)
-            if total_bytes
-            else 0,
-            priority="primary",
-            pages_found_on=[url],
-            searchable_snippet=_extract_snippet(ns),
-        ))
-
-    return findings
+# XPath selectors run the attribute filters inside libxml2, so Python
+# only ever sees the matching elements.
+_STYLED_XPATH = etree.XPath("//*[@style]")
+_HIDDEN_XPATH = etree.XPath(
+    '//*[@hidden'
+    ' or contains(@style, "display:none")'
+    ' or contains(@style, "display: none")]'
+)
 
 
-def _analyze_inline_style_attributes(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
+def _analyze_inline_style_attributes(tree, ctx: _AnalysisContext) -> None:
     """Find excessive use of inline style="..." attributes."""
-    findings = []
     min_total_style_bytes = 3000
 
-    total_style_bytes = 0
-    elements_with_style = 0
-
-    for tag in soup.find_all(True):
-        style = tag.get("style")
-        if not style:
-            continue
-            
-        style_str = " ".join(style) if isinstance(style, list) else style
-        total_style_bytes += _content_byte_size(style_str)
-        elements_with_style += 1
+    elements = _STYLED_XPATH(tree)
+    total_style_bytes = sum(
+        _content_byte_size(el.attrib["style"]) for el in elements
+    )
+    elements_with_style = len(elements)
 
     if total_style_bytes >= min_total_style_bytes:
-        findings.append(Finding(
+        ctx.findings.append(Finding(
             element_type="inline-style-attributes",
             element_identifier=f"{elements_with_style} style attributes",
             description=f"Excessive inline CSS properties across {elements_with_style} elements",
             visibility="backend",
             size_bytes=total_style_bytes,
-            percent_of_page=(total_style_bytes / total_bytes * 100)
-            if total_bytes
-            else 0,
+            percent_of_page=ctx.percent(total_style_bytes),
             priority="primary",
-            pages_found_on=[url],
+            pages_found_on=[ctx.url],
             searchable_snippet=f"Found {elements_with_style} elements with inline styles totaling {total_style_bytes} bytes.",
         ))
 
-    return findings
-
-
-def _analyze_external_scripts(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Catalog external <script src="..."> tags (secondary priority)."""
-    findings = []
-
-    for script in soup.find_all("script", src=True):
-        src = script["src"]
-        is_async = script.get("async") is not None
-        is_defer = script.get("defer") is not None
-
-        description, visibility = classify_external_resource(src)
-        loading = []
-        if is_async:
-            loading.append("async")
-        if is_defer:
-            loading.append("defer")
-        if loading:
-            description += f" ({', '.join(loading)})"
-
-        # The tag itself is small in the HTML (just the <script> tag)
-        tag_size = _element_byte_size(script)
-
-        identifier = get_element_identifier("script", src=src)
-        findings.append(Finding(
-            element_type="external-script",
-            element_identifier=identifier,
-            description=description,
-            visibility=visibility,
-            size_bytes=tag_size,
-            percent_of_page=(tag_size / total_bytes * 100)
-            if total_bytes
-            else 0,
-            priority="secondary",
-            pages_found_on=[url],
-            searchable_snippet=_extract_snippet(script),
-        ))
-
-    return findings
 
+def _analyze_hidden_content(tree, ctx: _AnalysisContext) -> None:
+    """Find large hidden content blocks (display:none, hidden attr)."""
+    min_hidden_bytes = 2000  # Only flag hidden blocks > 2KB
 
-def _analyze_external_stylesheets(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Catalog external stylesheet <link> tags (secondary priority)."""
-    findings = []
-
-    for link in soup.find_all("link", rel="stylesheet"):
-        href = link.get("href", "")
-        if not href:
+    for element in _HIDDEN_XPATH(tree):
+        size = ctx.element_size(element)
+        if size < min_hidden_bytes:
             continue
 
-        description, visibility = classify_external_resource(href)
-        if description == "Unknown third-party resource":
-            description = "External stylesheet"
-            visibility = "user-visible"
-
-        tag_size = _element_byte_size(link)
-
-        identifier = get_element_identifier("link", src=href)
-        findings.append(Finding(
-            element_type="external-stylesheet",
+        attrib = element.attrib
+        identifier = get_element_identifier(
+            element.tag,
+            id_attr=attrib.get("id"),
+            class_attr=attrib.get("class") or "",
+        )
+        ctx.findings.append(Finding(
+            element_type="hidden-content",
             element_identifier=identifier,
-            description=description,
-            visibility=visibility,
-            size_bytes=tag_size,
-            percent_of_page=(tag_size / total_bytes * 100)
-            if total_bytes
-            else 0,
-            priority="secondary",
-            pages_found_on=[url],
-            searchable_snippet=_extract_snippet(link),
+            description="Hidden content block (display:none or hidden)",
+            visibility="backend",
+            size_bytes=size,
+            percent_of_page=ctx.percent(size),
+            priority="primary",
+            pages_found_on=[ctx.url],
+            searchable_snippet=ctx.snippet(element),
         ))
 
-    return findings
-
-
-def _analyze_images(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Catalog <img> tags (secondary priority, but count them)."""
-    findings = []
-    images = soup.find_all("img")
 
+def _finalize_images(ctx: _AnalysisContext) -> None:
+    """Emit the aggregate <img> finding (secondary priority)."""
+    images = ctx.images
     if not images:
-        return findings
-
-    total_img_tag_bytes = sum(_element_byte_size(img) for img in images)
-    lazy_count = sum(
-        1
-        for img in images
-        if img.get("loading") == "lazy"
-        or "lazy" in " ".join(img.get("class", []))
-    )
+        return
 
-    findings.append(Finding(
+    # One pass over the collected tags for both aggregates
+    total_img_tag_bytes = 0
+    lazy_count = 0
+    for img in images:
+        total_img_tag_bytes += ctx.element_size(img)
+        if img.get("loading") == "lazy" or "lazy" in (img.get("class") or ""):
+            lazy_count += 1
+
+    ctx.findings.append(Finding(
         element_type="images",
         element_identifier=f"<img> x {len(images)}",
         description=(
@@ -733,56 +751,91 @@ def _analyze_images(
         ),
         visibility="user-visible",
         size_bytes=total_img_tag_bytes,
-        percent_of_page=(total_img_tag_bytes / total_bytes * 100)
-        if total_bytes
-        else 0,
+        percent_of_page=ctx.percent(total_img_tag_bytes),
         priority="secondary",
-        pages_found_on=[url],
-        searchable_snippet=_extract_snippet(images[0] if images else ""),
+        pages_found_on=[ctx.url],
+        searchable_snippet=ctx.snippet(images[0]),
     ))
 
-    return findings
 
+def _analyze_large_dom_subtrees(
+    tree,
+    ctx: _AnalysisContext,
+) -> None:
+    """Find DOM elements with an unusually large number of descendants.
+
+    This is the one analyzer that still needs its own targeted pass,
+    since descendant counting can't be folded into the shared
+    top-down walk.
+    """
+    body = tree.find("body")
+    if body is None:
+        return
+
+    # One traversal to collect elements, then compute descendant counts
+    # bottom-up: children appear after their parent in document order,
+    # so a reversed pass accumulates each subtree count exactly once.
+    elements = [el for el in body.iter() if isinstance(el.tag, str)]
+    counts: dict[int, int] = {id(el): 0 for el in elements}
+    for element in reversed(elements):
+        parent = element.getparent()
+        parent_id = id(parent)
+        if parent_id in counts:
+            counts[parent_id] += counts[id(element)] + 1
+
+    # Document order guarantees parents are visited before children, so
+    # exclusion under a flagged subtree propagates with one parent probe
+    # per element instead of walking the ancestor chain each time.
+    excluded: set[int] = set()
+    for element in elements:
+        if element is body:
+            continue
 
-def _analyze_iframes(
-    soup: BeautifulSoup,
-    total_bytes: int,
-    url: str,
-) -> list[Finding]:
-    """Catalog <iframe> tags (secondary priority)."""
-    findings = []
+        # Skip elements nested inside already-flagged parents
+        if id(element.getparent()) in excluded:
+            excluded.add(id(element))
+            continue
 
-    for iframe in soup.find_all("iframe"):
-        src = iframe.get("src", "")
-        description, visibility = classify_external_resource(src)
-        if description == "Unknown third-party resource":
-            description = "Embedded iframe"
-            visibility = "user-visible"
+        num_descendants = counts[id(element)]
 
-        tag_size = _element_byte_size(iframe)
-        identifier = get_element_identifier("iframe", src=src)
+        if num_descendants < MIN_DOM_SUBTREE_DESCENDANTS:
+            continue
+
+        size = ctx.element_size(element)
+        # Only flag if it's a significant chunk of the total page
+        if ctx.total_bytes > 0 and size * ctx.pct_factor < 1.0:
+            continue
 
-        findings.append(Finding(
-            element_type="iframe",
+        excluded.add(id(element))
+
+        identifier = get_element_identifier(
+            element.tag,
+            id_attr=element.get("id"),
+            class_attr=_class_str(element),
+        )
+        ctx.findings.append(Finding(
+            element_type="large-dom-subtree",
             element_identifier=identifier,
-            description=description,
-            visibility=visibility,
-            size_bytes=tag_size,
-            percent_of_page=(tag_size / total_bytes * 100)
-            if total_bytes
-            else 0,
-            priority="secondary",
-            pages_found_on=[url],
-            searchable_snippet=_extract_snippet(iframe),
+            description=(
+                f"Large DOM subtree with {num_descendants} "
+                f"descendant elements"
+            ),
+            visibility="user-visible",
+            size_bytes=size,
+            percent_of_page=ctx.percent(size),
+            priority="primary",
+            pages_found_on=[ctx.url],
+            searchable_snippet=ctx.snippet(element),
         ))
 
-    return findings
-
 
 def analyze_page(url: str, html: str) -> PageAnalysis:
     """Perform a complete weight analysis on a single HTML page.
 
-    Runs all primary and secondary analyzers and returns a
+    Parses with lxml and walks the tree exactly once, dispatching each element to
+    the relevant handlers via _TAG_HANDLERS and folding the global
+    attribute/comment passes into the same loop. Only the large-DOM-
+    subtree detection needs a second, body-only pass. Returns a
     PageAnalysis object with all findings sorted by size descending.
 
     Args:
@@ -793,32 +846,135 @@ def analyze_page(url: str, html: str) -> PageAnalysis:
         A PageAnalysis with all findings.
     """
     total_bytes = _content_byte_size(html)
-    soup = BeautifulSoup(html, "lxml")
-
-    all_findings: list[Finding] = []
-
-    # Primary analyzers — inline content contributing to file size
-    all_findings.extend(_analyze_inline_scripts(soup, total_bytes, url))
-    all_findings.extend(_analyze_inline_styles(soup, total_bytes, url))
-    all_findings.extend(_analyze_inline_svgs(soup, total_bytes, url))
-    all_findings.extend(_analyze_data_uris(soup, total_bytes, url))
-    all_findings.extend(_analyze_large_dom_subtrees(soup, total_bytes, url))
-    all_findings.extend(_analyze_hidden_content(soup, total_bytes, url))
-    all_findings.extend(_analyze_html_comments(soup, total_bytes, url))
-    all_findings.extend(_analyze_noscript_blocks(soup, total_bytes, url))
-    all_findings.extend(_analyze_inline_style_attributes(soup, total_bytes, url))
-
-    # Secondary analyzers — external resources (less impactful on file size)
-    all_findings.extend(_analyze_external_scripts(soup, total_bytes, url))
-    all_findings.extend(_analyze_external_stylesheets(soup, total_bytes, url))
-    all_findings.extend(_analyze_images(soup, total_bytes, url))
-    all_findings.extend(_analyze_iframes(soup, total_bytes, url))
+
+    # Parse as bytes: lxml refuses str input that carries an
+    # <?xml ... encoding=...?> declaration, and XHTML pages do. An
+    # empty or hopelessly broken document yields an empty analysis
+    # instead of aborting the whole batch.
+    try:
+        tree = lxml_html.fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return PageAnalysis(
+            url=url,
+            total_html_bytes=total_bytes,
+            findings=[],
+        )
+
+    ctx = _AnalysisContext(
+        url=url,
+        total_bytes=total_bytes,
+    )
+
+    # Screen the raw markup once so the walk only dispatches to
+    # handlers whose tags actually occur somewhere in the document.
+    # Tags are case-insensitive in HTML (and lxml lowercases them), so
+    # screen a lowercased copy — one .lower() pass is far cheaper than
+    # the parse it guards.
+    markup = html.lower()
+    handlers = {
+        tag: handler
+        for tag, handler in _TAG_HANDLERS.items()
+        if _TAG_MARKERS[tag] in markup
+    }
+    has_comments = "<!--" in markup
+    get_handler = handlers.get
+
+    # Single shared traversal of the whole document
+    for el in tree.iter():
+        tag = el.tag
+        if isinstance(tag, str):
+            if handlers:
+                handler = get_handler(tag)
+                if handler is not None:
+                    handler(el, ctx)
+        elif has_comments and tag is etree.Comment:
+            ctx.comments.append(el)
+
+    # Aggregate findings accumulated during the walk
+    if has_comments:
+        _finalize_comments(ctx)
+    if ctx.images:
+        _finalize_images(ctx)
+
+    # Attribute-filtered analyzers, pushed down into libxml2 via XPath
+    _analyze_inline_style_attributes(tree, ctx)
+    _analyze_hidden_content(tree, ctx)
+    if "data:" in markup:
+        _analyze_data_uris(tree, ctx)
+
+    # Second targeted pass: large DOM subtrees (body only)
+    _analyze_large_dom_subtrees(tree, ctx)
 
     # Sort by size descending
-    all_findings.sort(key=lambda f: f.size_bytes, reverse=True)
+    ctx.findings.sort(key=lambda f: f.size_bytes, reverse=True)
 
     return PageAnalysis(
         url=url,
         total_html_bytes=total_bytes,
-        findings=all_findings,
+        findings=ctx.findings,
     )
+
+
+def _materialize_snippets(analysis: PageAnalysis) -> PageAnalysis:
+    """Resolve any deferred snippets in place.
+
+    Worker processes call this before returning, so only the final
+    snippet strings cross the pickle boundary rather than the cached
+    element bytes held by the deferred callables.
+    """
+    for finding in analysis.findings:
+        snippet = finding.searchable_snippet
+        if callable(snippet):
+            finding.searchable_snippet = snippet()
+    return analysis
+
+
+def _analyze_page_args(args: tuple[str, str]) -> PageAnalysis:
+    """Unpack a (url, html) tuple for executor.map."""
+    return _materialize_snippets(analyze_page(*args))
+
+
+def analyze_pages(
+    pages: Iterable[tuple[str, str]],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[PageAnalysis], None]] = None,
+) -> list[PageAnalysis]:
+    """Analyze a batch of pages in parallel across processes.
+
+    analyze_page is CPU-bound (parsing plus classification) and fully
+    independent per URL, so a process pool scales roughly linearly
+    with core count.
+
+    Args:
+        pages: Iterable of (url, html) tuples.
+        workers: Number of worker processes (default: CPU count).
+        on_result: Optional callback invoked with each PageAnalysis as
+            it completes (e.g. to advance a progress bar).
+
+    Returns:
+        A list of PageAnalysis results in input order.
+    """
+    pages = list(pages)
+    if not pages:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pages) == 1:
+        results = []
+        for url, html in pages:
+            analysis = analyze_page(url, html)
+            if on_result is not None:
+                on_result(analysis)
+            results.append(analysis)
+        return results
+
+    chunksize = max(1, len(pages) // (workers * 4))
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for analysis in pool.map(
+            _analyze_page_args, pages, chunksize=chunksize
+        ):
+            if on_result is not None:
+                on_result(analysis)
+            results.append(analysis)
+    return results
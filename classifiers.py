@@ -4,370 +4,492 @@ Maps URL patterns and script/style signatures to human-readable
 descriptions and visibility labels.
 """
 
+import functools
 import re
+import sys
 from typing import Optional, Tuple
-
-# Each entry: (compiled_regex_pattern, purpose_description, visibility)
-# visibility is either "user-visible" or "backend"
-KNOWN_SCRIPT_PATTERNS: list[Tuple[re.Pattern, str, str]] = [
-    # --- Analytics ---
-    (
-        re.compile(r"google[-_]?analytics|ga\.js|analytics\.js", re.I),
+from urllib.parse import urlparse
+
+# Each entry: (pattern_text, purpose_description, visibility).
+# visibility is either "user-visible" or "backend". Pattern text is kept
+# raw here; compilation happens lazily in the cached matcher getters
+# below, so importing this module (which every CLI invocation does,
+# even for --help) doesn't pay for ~60 re.compile calls up front.
+KNOWN_SCRIPT_PATTERNS: list[Tuple[str, str, str]] = [
+    # Ordered roughly by observed hit frequency: GA/gtag/GTM, the
+    # Shopify CDN, and Sentry account for most matches on real crawls,
+    # so they sit ahead of the thematic sections below. First match
+    # wins wherever entries overlap.
+    (
+        r"google[-_]?analytics|ga\.js|analytics\.js",
         "Google Analytics",
         "backend",
     ),
     (
-        re.compile(r"gtag/js|googletagmanager\.com/gtag", re.I),
+        r"gtag/js|googletagmanager\.com/gtag",
         "Google Analytics 4 (gtag)",
         "backend",
     ),
     (
-        re.compile(r"googletagmanager\.com/gtm", re.I),
+        r"googletagmanager\.com/gtm",
         "Google Tag Manager",
         "backend",
     ),
     (
-        re.compile(r"hotjar\.com|static\.hotjar\.com", re.I),
+        r"cdn\.shopify\.com",
+        "Shopify platform script",
+        "backend",
+    ),
+    (
+        r"sentry\.io|browser\.sentry",
+        "Sentry (error monitoring)",
+        "backend",
+    ),
+
+    # --- Analytics ---
+    (
+        r"hotjar\.com|static\.hotjar\.com",
         "Hotjar (heatmaps/recordings)",
         "backend",
     ),
     (
-        re.compile(r"fullstory\.com|fs\.js", re.I),
+        r"fullstory\.com|fs\.js",
         "FullStory (session replay)",
         "backend",
     ),
     (
-        re.compile(r"heap[-_]?analytics|heapanalytics\.com", re.I),
+        r"heap[-_]?analytics|heapanalytics\.com",
         "Heap Analytics",
         "backend",
     ),
     (
-        re.compile(r"amplitude\.com|amplitude\.min\.js", re.I),
+        r"amplitude\.com|amplitude\.min\.js",
         "Amplitude Analytics",
         "backend",
     ),
     (
-        re.compile(r"mixpanel\.com|mixpanel\.min\.js", re.I),
+        r"mixpanel\.com|mixpanel\.min\.js",
         "Mixpanel Analytics",
         "backend",
     ),
     (
-        re.compile(r"segment\.com|analytics\.min\.js|cdn\.segment", re.I),
+        r"segment\.com|analytics\.min\.js|cdn\.segment",
         "Segment (analytics router)",
         "backend",
     ),
     (
-        re.compile(r"tealium\.com|utag\.js", re.I),
+        r"tealium\.com|utag\.js",
         "Tealium (tag management)",
         "backend",
     ),
     (
-        re.compile(r"adobe.*analytics|omniture|s_code\.js", re.I),
+        r"adobe.*analytics|omniture|s_code\.js",
         "Adobe Analytics",
         "backend",
     ),
     (
-        re.compile(r"clarity\.ms|clarity\.js", re.I),
+        r"clarity\.ms|clarity\.js",
         "Microsoft Clarity",
         "backend",
     ),
 
     # --- Advertising / Tracking Pixels ---
     (
-        re.compile(r"connect\.facebook\.net|fbevents\.js|fbq\(", re.I),
+        r"connect\.facebook\.net|fbevents\.js|fbq\(",
         "Facebook/Meta Pixel",
         "backend",
     ),
     (
-        re.compile(r"googleads|google_ads|conversion\.js|adservices", re.I),
+        r"googleads|google_ads|conversion\.js|adservices",
         "Google Ads conversion tracking",
         "backend",
     ),
     (
-        re.compile(r"snap\.licdn|linkedin\.com/insight|_linkedin_", re.I),
+        r"snap\.licdn|linkedin\.com/insight|_linkedin_",
         "LinkedIn Insight Tag",
         "backend",
     ),
     (
-        re.compile(r"tiktok\.com/i18n|ttq\.", re.I),
+        r"tiktok\.com/i18n|ttq\.",
         "TikTok Pixel",
         "backend",
     ),
     (
-        re.compile(r"pinterest\.com/ct\.js|pintrk\(", re.I),
+        r"pinterest\.com/ct\.js|pintrk\(",
         "Pinterest Tag",
         "backend",
     ),
     (
-        re.compile(r"ads\.twitter|static\.ads-twitter", re.I),
+        r"ads\.twitter|static\.ads-twitter",
         "Twitter/X Ads Pixel",
         "backend",
     ),
     (
-        re.compile(r"criteo\.com|criteo\.net", re.I),
+        r"criteo\.com|criteo\.net",
         "Criteo (retargeting)",
         "backend",
     ),
 
     # --- Chat / Support ---
     (
-        re.compile(r"intercom\.io|intercomcdn\.com|widget\.intercom", re.I),
+        r"intercom\.io|intercomcdn\.com|widget\.intercom",
         "Intercom (chat/support widget)",
         "user-visible",
     ),
     (
-        re.compile(r"drift\.com|js\.driftt\.com", re.I),
+        r"drift\.com|js\.driftt\.com",
         "Drift (chat widget)",
         "user-visible",
     ),
     (
-        re.compile(r"zendesk\.com|zdassets\.com|zopim", re.I),
+        r"zendesk\.com|zdassets\.com|zopim",
         "Zendesk (support widget)",
         "user-visible",
     ),
     (
-        re.compile(r"livechat|livechatinc\.com", re.I),
+        r"livechat|livechatinc\.com",
         "LiveChat widget",
         "user-visible",
     ),
     (
-        re.compile(r"tawk\.to", re.I),
+        r"tawk\.to",
         "Tawk.to (chat widget)",
         "user-visible",
     ),
     (
-        re.compile(r"crisp\.chat|client\.crisp\.chat", re.I),
+        r"crisp\.chat|client\.crisp\.chat",
         "Crisp (chat widget)",
         "user-visible",
     ),
     (
-        re.compile(r"gorgias", re.I),
+        r"gorgias",
         "Gorgias (support widget)",
         "user-visible",
     ),
 
     # --- E-commerce Platforms ---
     (
-        re.compile(r"cdn\.shopify\.com", re.I),
-        "Shopify platform script",
-        "backend",
-    ),
-    (
-        re.compile(r"shopify-analytics|shopify_analytics", re.I),
+        r"shopify-analytics|shopify_analytics",
         "Shopify Analytics",
         "backend",
     ),
     (
-        re.compile(r"klaviyo\.com|static\.klaviyo", re.I),
+        r"klaviyo\.com|static\.klaviyo",
         "Klaviyo (email marketing)",
         "backend",
     ),
     (
-        re.compile(r"yotpo\.com", re.I),
+        r"yotpo\.com",
         "Yotpo (reviews widget)",
         "user-visible",
     ),
     (
-        re.compile(r"judge\.me", re.I),
+        r"judge\.me",
         "Judge.me (reviews widget)",
         "user-visible",
     ),
     (
-        re.compile(r"stamped\.io", re.I),
+        r"stamped\.io",
         "Stamped.io (reviews/loyalty)",
         "user-visible",
     ),
     (
-        re.compile(r"loox\.io", re.I),
+        r"loox\.io",
         "Loox (reviews widget)",
         "user-visible",
     ),
     (
-        re.compile(r"recharge\.com|rechargepayments", re.I),
+        r"recharge\.com|rechargepayments",
         "ReCharge (subscriptions)",
         "user-visible",
     ),
     (
-        re.compile(r"afterpay|afterpay\.js", re.I),
+        r"afterpay|afterpay\.js",
         "Afterpay (BNPL widget)",
         "user-visible",
     ),
     (
-        re.compile(r"klarna", re.I),
+        r"klarna",
         "Klarna (BNPL widget)",
         "user-visible",
     ),
 
     # --- Fonts ---
     (
-        re.compile(r"fonts\.googleapis\.com|fonts\.gstatic\.com", re.I),
+        r"fonts\.googleapis\.com|fonts\.gstatic\.com",
         "Google Fonts",
         "user-visible",
     ),
     (
-        re.compile(r"use\.typekit\.net|typekit", re.I),
+        r"use\.typekit\.net|typekit",
         "Adobe Fonts / Typekit",
         "user-visible",
     ),
 
     # --- CDN / Frameworks ---
     (
-        re.compile(r"jquery\.min\.js|jquery[-.](\d)", re.I),
+        r"jquery\.min\.js|jquery[-.](\d)",
         "jQuery library",
         "backend",
     ),
     (
-        re.compile(r"react\.production\.min|react-dom", re.I),
+        r"react\.production\.min|react-dom",
         "React framework",
         "backend",
     ),
     (
-        re.compile(r"bootstrap\.min\.(js|css)", re.I),
+        r"bootstrap\.min\.(js|css)",
         "Bootstrap framework",
         "user-visible",
     ),
     (
-        re.compile(r"unpkg\.com|cdnjs\.cloudflare\.com|cdn\.jsdelivr", re.I),
+        r"unpkg\.com|cdnjs\.cloudflare\.com|cdn\.jsdelivr",
         "Public CDN resource",
         "backend",
     ),
 
     # --- Consent / Privacy ---
     (
-        re.compile(r"cookiebot|consent\.cookiebot", re.I),
+        r"cookiebot|consent\.cookiebot",
         "Cookiebot (consent management)",
         "user-visible",
     ),
     (
-        re.compile(r"onetrust\.com|optanon", re.I),
+        r"onetrust\.com|optanon",
         "OneTrust (consent management)",
         "user-visible",
     ),
     (
-        re.compile(r"trustarc|truste\.com", re.I),
+        r"trustarc|truste\.com",
         "TrustArc (privacy management)",
         "user-visible",
     ),
 
     # --- Performance / Monitoring ---
     (
-        re.compile(r"sentry\.io|browser\.sentry", re.I),
-        "Sentry (error monitoring)",
-        "backend",
-    ),
-    (
-        re.compile(r"newrelic\.com|nr-data\.net|NREUM", re.I),
+        r"newrelic\.com|nr-data\.net|NREUM",
         "New Relic (APM)",
         "backend",
     ),
     (
-        re.compile(r"datadog.*rum|datadoghq\.com", re.I),
+        r"datadog.*rum|datadoghq\.com",
         "Datadog RUM",
         "backend",
     ),
 ]
 
-KNOWN_INLINE_PATTERNS: list[Tuple[re.Pattern, str, str]] = [
+KNOWN_INLINE_PATTERNS: list[Tuple[str, str, str]] = [
     (
-        re.compile(r"gtag\s*\(|dataLayer\.push", re.I),
+        r"gtag\s*\(|dataLayer\.push",
         "Google Tag Manager / gtag inline config",
         "backend",
     ),
     (
-        re.compile(r"fbq\s*\(", re.I),
+        r"fbq\s*\(",
         "Facebook Pixel inline initialization",
         "backend",
     ),
     (
-        re.compile(r"_learnq|klaviyo", re.I),
+        r"_learnq|klaviyo",
         "Klaviyo inline tracking",
         "backend",
     ),
     (
-        re.compile(r"shopify\..*analytics|Shopify\.analytics", re.I),
+        r"shopify\..*analytics|Shopify\.analytics",
         "Shopify inline analytics",
         "backend",
     ),
     (
-        re.compile(r"ttq\.", re.I),
+        r"ttq\.",
         "TikTok Pixel inline initialization",
         "backend",
     ),
     (
-        re.compile(r"pintrk\s*\(", re.I),
+        r"pintrk\s*\(",
         "Pinterest Tag inline initialization",
         "backend",
     ),
     (
-        re.compile(r"hj\s*\(|_hjSettings", re.I),
+        r"hj\s*\(|_hjSettings",
         "Hotjar inline initialization",
         "backend",
     ),
     (
-        re.compile(r"intercomSettings|window\.Intercom", re.I),
+        r"intercomSettings|window\.Intercom",
         "Intercom inline configuration",
         "user-visible",
     ),
     (
-        re.compile(r"window\.__reactRouterContext", re.I),
+        r"window\.__reactRouterContext",
         "React Router / Hydrogen hydration state (large data payload)",
         "backend",
     ),
     (
-        re.compile(r"window\.__REDUX_STATE__", re.I),
+        r"window\.__REDUX_STATE__",
         "Redux initial state payload",
         "backend",
     ),
     (
-        re.compile(r"Shopify\.theme", re.I),
+        r"Shopify\.theme",
         "Shopify theme configuration",
         "backend",
     ),
 ]
 
-# Patterns for classifying JSON-LD structured data
-JSON_LD_TYPE_PATTERNS: list[Tuple[re.Pattern, str, str]] = [
-    (
-        re.compile(r'"@type"\s*:\s*"Product"', re.I),
-        "Product structured data (JSON-LD)",
-        "backend",
-    ),
-    (
-        re.compile(r'"@type"\s*:\s*"BreadcrumbList"', re.I),
-        "Breadcrumb structured data (JSON-LD)",
-        "backend",
-    ),
-    (
-        re.compile(r'"@type"\s*:\s*"Organization"', re.I),
-        "Organization structured data (JSON-LD)",
-        "backend",
-    ),
-    (
-        re.compile(r'"@type"\s*:\s*"WebSite"', re.I),
-        "Website structured data (JSON-LD)",
-        "backend",
-    ),
-    (
-        re.compile(r'"@type"\s*:\s*"Article"', re.I),
-        "Article structured data (JSON-LD)",
-        "backend",
-    ),
-    (
-        re.compile(r'"@type"\s*:\s*"CollectionPage"', re.I),
-        "Collection page structured data (JSON-LD)",
-        "backend",
-    ),
-    (
-        re.compile(r'"@type"\s*:\s*"ItemList"', re.I),
-        "Item list structured data (JSON-LD)",
-        "backend",
-    ),
-]
+# JSON-LD classification: "@type" values mapped (lowercased) to their
+# description. One regex pulls the first "@type" value out of the
+# payload; everything else is a dict lookup.
+JSON_LD_TYPE_MAP: dict[str, Tuple[str, str]] = {
+    "product": ("Product structured data (JSON-LD)", "backend"),
+    "breadcrumblist": ("Breadcrumb structured data (JSON-LD)", "backend"),
+    "organization": ("Organization structured data (JSON-LD)", "backend"),
+    "website": ("Website structured data (JSON-LD)", "backend"),
+    "article": ("Article structured data (JSON-LD)", "backend"),
+    "collectionpage": ("Collection page structured data (JSON-LD)", "backend"),
+    "itemlist": ("Item list structured data (JSON-LD)", "backend"),
+}
+
+
+def _intern_table(patterns):
+    """Intern a table's description and visibility strings.
+
+    Classifications are returned for millions of elements over a crawl
+    and end up as dict keys during aggregation; interned strings hash
+    and compare by pointer.
+    """
+    return [
+        (pattern_text, sys.intern(description), sys.intern(visibility))
+        for pattern_text, description, visibility in patterns
+    ]
+
+
+KNOWN_SCRIPT_PATTERNS = _intern_table(KNOWN_SCRIPT_PATTERNS)
+KNOWN_INLINE_PATTERNS = _intern_table(KNOWN_INLINE_PATTERNS)
+JSON_LD_TYPE_MAP = {
+    key: (sys.intern(description), sys.intern(visibility))
+    for key, (description, visibility) in JSON_LD_TYPE_MAP.items()
+}
+# Union-compiled content signatures: one alternation with a named group
+# per source pattern, so large inline bodies are scanned once instead of
+# once per pattern. The parallel meta list maps the matched group index
+# back to (description, visibility).
+def _build_union_matcher(patterns):
+    """Combine a pattern table into (union_regex, meta_list)."""
+    union = re.compile(
+        "|".join(
+            f"(?P<p{i}>{pattern_text})"
+            for i, (pattern_text, _, _) in enumerate(patterns)
+        ),
+        re.I,
+    )
+    meta = [(description, visibility) for _, description, visibility in patterns]
+    return union, meta
+
+
+@functools.cache
+def _inline_matcher():
+    """Lazily built (union_regex, meta) for KNOWN_INLINE_PATTERNS."""
+    return _build_union_matcher(KNOWN_INLINE_PATTERNS)
+
+
+@functools.cache
+def _json_ld_type_re():
+    """Lazily compiled extractor for the first "@type" value."""
+    return re.compile(r'"@type"\s*:\s*"([^"]+)"')
+
+
+_REGEX_SPECIALS = set(".^$*+?()[]{}|\\")
+
+
+def _as_literal(alternative: str) -> Optional[str]:
+    """Unescape a regex alternative if it is a plain literal.
+
+    Returns the literal string, or None when the alternative uses any
+    real regex syntax (classes, quantifiers, groups, shorthand escapes).
+    """
+    chars = []
+    i = 0
+    while i < len(alternative):
+        c = alternative[i]
+        if c == "\\":
+            if i + 1 >= len(alternative) or alternative[i + 1].isalnum():
+                return None
+            chars.append(alternative[i + 1])
+            i += 2
+        elif c in _REGEX_SPECIALS:
+            return None
+        else:
+            chars.append(c)
+            i += 1
+    return "".join(chars)
+
+
+def _build_literal_matcher(patterns):
+    """Compile a table's literal alternatives into one search.
+
+    Nearly every KNOWN_SCRIPT_PATTERNS entry is a disjunction of plain
+    substrings, so all of those literals are folded into a single
+    alternation scanned once per URL, with a dict mapping the matched
+    literal back to its (description, visibility). Entries with any
+    non-literal alternative stay in a small fallback list that is only
+    consulted when the literal scan misses.
+    """
+    literal_map: dict[str, Tuple[str, str]] = {}
+    fallback = []
+    for pattern_text, description, visibility in patterns:
+        alternatives = pattern_text.split("|")
+        literals = [_as_literal(alt) for alt in alternatives]
+        if None in literals:
+            # Compiled without IGNORECASE: the caller lowercases the
+            # URL once, so case folding inside the regex engine is
+            # redundant work on every character.
+            fallback.append((
+                re.compile(pattern_text.lower()),
+                description,
+                visibility,
+            ))
+        for literal in literals:
+            if literal is not None:
+                literal_map.setdefault(literal.lower(), (description, visibility))
+    union = re.compile("|".join(re.escape(lit) for lit in literal_map))
+    return union, literal_map, fallback
+
+
+@functools.cache
+def _script_matcher():
+    """Lazily built (union, literal_map, fallback) for script URLs."""
+    return _build_literal_matcher(KNOWN_SCRIPT_PATTERNS)
+
+
+@functools.cache
+def _host_map():
+    """Hostname-shaped literals from the script table, keyed for O(1) lookup.
+
+    Most signatures are plain hostnames ("connect.facebook.net",
+    "fonts.googleapis.com"); matching those against the URL's netloc is
+    a dict probe, no regex. Filename-style literals (*.js, *.css) and
+    anything with path or code characters stay out of the map.
+    """
+    _, literal_map, _ = _script_matcher()
+    return {
+        literal: meta
+        for literal, meta in literal_map.items()
+        if "." in literal
+        and not any(c in literal for c in "/_(")
+        and not literal.endswith((".js", ".css"))
+    }
 
 
+@functools.lru_cache(maxsize=4096)
 def classify_external_resource(url: str) -> Tuple[str, str]:
     """Classify an external resource URL.
 
+    One alternation of every known literal signature is scanned once
+    over the lowercased URL; only URLs that miss fall through to the
+    handful of genuinely non-literal patterns. Results are memoized per
+    URL: CDN and analytics URLs repeat across every page of a crawl,
+    so most calls are cache hits.
+
     Args:
         url: The URL of the external resource.
 
@@ -376,15 +498,53 @@ def classify_external_resource(url: str) -> Tuple[str, str]:
         Falls back to ("Unknown third-party resource", "backend")
         if no pattern matches.
     """
-    for pattern, description, visibility in KNOWN_SCRIPT_PATTERNS:
-        if pattern.search(url):
+    url_lower = url.lower()
+
+    # Hostname fast path: look the netloc (and each parent-domain
+    # suffix) up directly before falling back to any regex work.
+    host_map = _host_map()
+    host = urlparse(url_lower).netloc
+    if host:
+        labels = host.split(".")
+        for i in range(len(labels) - 1):
+            hit = host_map.get(".".join(labels[i:]))
+            if hit is not None:
+                return hit
+
+    literal_re, literal_map, fallback_patterns = _script_matcher()
+    match = literal_re.search(url_lower)
+    if match:
+        return literal_map[match.group(0)]
+    for pattern, description, visibility in fallback_patterns:
+        if pattern.search(url_lower):
             return description, visibility
     return "Unknown third-party resource", "backend"
 
 
+@functools.lru_cache(maxsize=4096)
+def _classify_inline_prefix(prefix: str) -> Tuple[str, str]:
+    """Classify an inline script by its leading content (memoized)."""
+    union, meta = _inline_matcher()
+    match = union.search(prefix)
+    if match:
+        return meta[int(match.lastgroup[1:])]
+
+    # Extract a preview snippet of the first 80 characters (ignoring whitespace)
+    snippet = prefix.strip().replace("\n", " ")[:80]
+    if len(prefix.strip()) > 80:
+        snippet += "..."
+
+    return f"Custom inline code ({snippet})", "backend"
+
+
 def classify_inline_content(content: str) -> Tuple[str, str]:
     """Classify inline script content by checking for known signatures.
 
+    Known signatures (gtag bootstraps, pixel inits, etc.) sit at the
+    top of the snippet, so matching is keyed on the first 256
+    characters and memoized — duplicated boilerplate snippets across a
+    crawl classify once.
+
     Args:
         content: The text content of an inline script/style tag.
 
@@ -392,55 +552,56 @@ def classify_inline_content(content: str) -> Tuple[str, str]:
         A tuple of (purpose_description, visibility_label).
         Falls back to showing a snippet if no match.
     """
-    for pattern, description, visibility in KNOWN_INLINE_PATTERNS:
-        if pattern.search(content):
-            return description, visibility
+    return _classify_inline_prefix(content[:256])
 
-    # Extract a preview snippet of the first 80 characters (ignoring whitespace)
-    snippet = content.strip().replace("\n", " ")[:80]
-    if len(content.strip()) > 80:
-        snippet += "..."
 
-    return f"Custom inline code ({snippet})", "backend"
+@functools.lru_cache(maxsize=4096)
+def _classify_json_ld_prefix(prefix: str) -> Tuple[str, str]:
+    """Classify a JSON-LD payload by its leading content (memoized)."""
+    match = _json_ld_type_re().search(prefix)
+    if match:
+        known = JSON_LD_TYPE_MAP.get(match.group(1).lower())
+        if known is not None:
+            return known
+    return "Structured data (JSON-LD)", "backend"
 
 
 def classify_json_ld(content: str) -> Tuple[str, str]:
     """Classify JSON-LD structured data content.
 
+    The "@type" key appears at the head of the payload, so matching is
+    keyed on the first 256 characters and memoized.
+
     Args:
         content: The text content of a JSON-LD script tag.
 
     Returns:
         A tuple of (purpose_description, visibility_label).
     """
-    for pattern, description, visibility in JSON_LD_TYPE_PATTERNS:
-        if pattern.search(content):
-            return description, visibility
-    return "Structured data (JSON-LD)", "backend"
+    return _classify_json_ld_prefix(content[:256])
 
 
 def classify_svg(svg_element) -> Tuple[str, str]:
     """Classify an inline SVG element.
 
     Args:
-        svg_element: A BeautifulSoup Tag for an <svg> element.
+        svg_element: An lxml element for an <svg> tag.
 
     Returns:
         A tuple of (purpose_description, visibility_label).
     """
-    # Check for common icon-system patterns
-    use_tags = svg_element.find_all("use")
-    symbol_tags = svg_element.find_all("symbol")
-
-    if symbol_tags:
+    # Check for common icon-system patterns. Only presence matters, so
+    # find() stops at the first hit instead of collecting the whole
+    # subtree, and the <use> probe is skipped when a <symbol> decides.
+    if svg_element.find(".//symbol") is not None:
         return "SVG symbol sprite sheet", "user-visible"
-    if use_tags:
+    if svg_element.find(".//use") is not None:
         return "SVG icon (via <use> reference)", "user-visible"
 
     # Check if it's hidden (sprite sheets often are)
-    style = svg_element.get("style", "")
-    aria_hidden = svg_element.get("aria-hidden", "")
-    class_attr = " ".join(svg_element.get("class", []))
+    style = svg_element.get("style") or ""
+    aria_hidden = svg_element.get("aria-hidden") or ""
+    class_attr = svg_element.get("class") or ""
 
     if "display:none" in style.replace(" ", "") or "hidden" in class_attr:
         return "Hidden SVG sprite sheet", "backend"
@@ -451,26 +612,66 @@ def classify_svg(svg_element) -> Tuple[str, str]:
     return "Inline SVG graphic", "user-visible"
 
 
+# Exact MIME types first, then top-level categories as the fallback.
+_DATA_URI_MIME_MAP: dict[str, Tuple[str, str]] = {
+    "image/svg+xml": ("Inline SVG data URI", "user-visible"),
+    "image/svg": ("Inline SVG data URI", "user-visible"),
+    "application/json": ("Inline JSON data URI", "backend"),
+}
+_DATA_URI_CATEGORY_MAP: dict[str, Tuple[str, str]] = {
+    "image": ("Inline base64-encoded image", "user-visible"),
+    "font": ("Inline base64-encoded font", "user-visible"),
+}
+_DATA_URI_MIME_MAP = {
+    key: (sys.intern(description), sys.intern(visibility))
+    for key, (description, visibility) in _DATA_URI_MIME_MAP.items()
+}
+_DATA_URI_CATEGORY_MAP = {
+    key: (sys.intern(description), sys.intern(visibility))
+    for key, (description, visibility) in _DATA_URI_CATEGORY_MAP.items()
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_data_uri_prefix(prefix: str) -> Tuple[str, str]:
+    """Classify a data URI by its MIME type (memoized).
+
+    The MIME type is parsed out of "data:<mime>[;...][,...]" once and
+    dispatched through dict lookups instead of a chain of prefix
+    comparisons.
+    """
+    end = len(prefix)
+    for stop in (";", ","):
+        pos = prefix.find(stop, 5)
+        if pos != -1 and pos < end:
+            end = pos
+    mime = prefix[5:end]
+
+    exact = _DATA_URI_MIME_MAP.get(mime)
+    if exact is not None:
+        return exact
+    if mime.startswith("application/font"):
+        return "Inline base64-encoded font", "user-visible"
+    category = _DATA_URI_CATEGORY_MAP.get(mime.partition("/")[0])
+    if category is not None:
+        return category
+    return "Inline data URI", "backend"
+
+
 def classify_data_uri(data_uri: str) -> Tuple[str, str]:
     """Classify a base64 data URI.
 
+    Classification only looks at the MIME prefix, so matching is keyed
+    on the first 64 characters rather than the full (often very long)
+    URI.
+
     Args:
         data_uri: The data URI string.
 
     Returns:
         A tuple of (purpose_description, visibility_label).
     """
-    if data_uri.startswith("data:image/svg"):
-        return "Inline SVG data URI", "user-visible"
-    if data_uri.startswith("data:image/"):
-        return "Inline base64-encoded image", "user-visible"
-    if data_uri.startswith("data:font/") or data_uri.startswith(
-        "data:application/font"
-    ):
-        return "Inline base64-encoded font", "user-visible"
-    if data_uri.startswith("data:application/json"):
-        return "Inline JSON data URI", "backend"
-    return "Inline data URI", "backend"
+    return _classify_data_uri_prefix(data_uri[:64])
 
 
 def get_element_identifier(
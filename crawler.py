@@ -6,8 +6,10 @@ to a local directory for inspection.
 
 import concurrent.futures
 import os
-import re
+import threading
 import time
+from collections import defaultdict
+from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -40,6 +42,65 @@ DEFAULT_HEADERS = {
 # Delay between requests in seconds (be polite).
 DEFAULT_DELAY = 1.0
 
+# Hard cap on downloaded HTML per page (pathological pages exist).
+MAX_FETCH_BYTES = 8 * 1024 * 1024
+
+# Shared session: keep-alive and connection pooling across the worker
+# threads, so same-host crawls reuse one TCP+TLS connection per worker
+# instead of handshaking on every URL. requests.Session is thread-safe
+# for plain GETs.
+SESSION = requests.Session()
+_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+# Per-host throttle state: serializing on the host lock spaces out
+# requests to one origin while leaving other hosts free to proceed.
+_HOST_LOCKS: defaultdict = defaultdict(threading.Lock)
+_HOST_LAST_REQUEST: dict[str, float] = {}
+
+
+def _throttle_host(url: str, delay: float) -> None:
+    """Block until the URL's host is due for another request.
+
+    Args:
+        url: The URL about to be fetched.
+        delay: Minimum seconds between requests to the same host.
+    """
+    if delay <= 0:
+        return
+    host = urlparse(url).netloc
+    with _HOST_LOCKS[host]:
+        now = time.monotonic()
+        last = _HOST_LAST_REQUEST.get(host)
+        if last is not None:
+            wait = delay - (now - last)
+            if wait > 0:
+                time.sleep(wait)
+                now = time.monotonic()
+        _HOST_LAST_REQUEST[host] = now
+
+
+class _SanitizeTable(dict):
+    """str.translate table mapping every unsafe character to "_"."""
+
+    def __missing__(self, code: int) -> str:
+        return "_"
+
+
+# Alphanumerics, underscore, and hyphen map to themselves; anything
+# else falls through __missing__. One C-level translate pass replaces
+# the regex substitution.
+_SANITIZE_TABLE = _SanitizeTable({
+    ord(c): c
+    for c in (
+        "abcdefghijklmnopqrstuvwxyz"
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        "0123456789_-"
+    )
+})
+
 
 def _sanitize_filename(url: str) -> str:
     """Convert a URL into a safe filename for caching.
@@ -52,8 +113,8 @@ def _sanitize_filename(url: str) -> str:
     """
     parsed = urlparse(url)
     path_part = parsed.path.strip("/").replace("/", "_") or "index"
-    # Remove non-alphanumeric characters except underscores and hyphens
-    safe_name = re.sub(r"[^a-zA-Z0-9_\-]", "_", path_part)
+    # Replace non-alphanumeric characters except underscores and hyphens
+    safe_name = path_part.translate(_SANITIZE_TABLE)
     return f"{safe_name}.html"
 
 
@@ -70,18 +131,28 @@ def fetch_page_html(
         headers: Optional custom HTTP headers.
 
     Returns:
-        The raw HTML string.
+        The raw HTML string, truncated at MAX_FETCH_BYTES.
 
     Raises:
         requests.HTTPError: If the response status is not 2xx.
     """
-    resp = requests.get(
+    resp = SESSION.get(
         url,
         headers=headers or DEFAULT_HEADERS,
         timeout=timeout,
+        stream=True,
     )
-    resp.raise_for_status()
-    return resp.text
+    with resp:
+        resp.raise_for_status()
+        # Read at most MAX_FETCH_BYTES of the decompressed body, then
+        # decode exactly once instead of letting resp.text re-detect
+        # and re-decode the whole payload.
+        body = resp.raw.read(MAX_FETCH_BYTES, decode_content=True)
+        encoding = resp.encoding or resp.apparent_encoding or "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
 
 
 def crawl_pages(
@@ -112,35 +183,55 @@ def crawl_pages(
     if total_urls == 0:
         return results
 
-    # Flatten the tasks so we can process them concurrently
-    tasks = []
+    # Group requests by URL: the same URL can be sampled under several
+    # templates, but it only needs to be fetched once and fanned out.
+    url_requests: dict[str, list[tuple[str, str]]] = {}
     for template, urls in sample_urls.items():
         for url in urls:
-            tasks.append((template, url))
+            # Sanitize template name so it doesn't cause os.path.join to jump to root
+            safe_template = template.strip("/").translate(_SANITIZE_TABLE) or "root"
+            filename = _sanitize_filename(url)
+            cache_path = os.path.join(cache_dir, f"{safe_template}_{filename}")
+            url_requests.setdefault(url, []).append((template, cache_path))
 
-    # Helper function for one url
-    def _process_url(template: str, url: str) -> tuple[str, str, str, str]:
-        """Returns (template, url, html, status_msg)"""
-        # Sanitize template name so it doesn't cause os.path.join to jump to root
-        safe_template = re.sub(r"[^a-zA-Z0-9_\-]", "_", template.strip("/")) or "root"
-        filename = _sanitize_filename(url)
-        cache_path = os.path.join(cache_dir, f"{safe_template}_{filename}")
-
-        if os.path.exists(cache_path):
-            with open(cache_path, "r", encoding="utf-8") as fh:
-                html = fh.read()
-            return template, url, html, "cached"
+    def _fan_out(url: str, html: str) -> None:
+        """Store one URL's HTML under every template that sampled it."""
+        for template, _ in url_requests[url]:
+            results[template][url] = html
+
+    # Split cache hits from real fetches: disk reads are served
+    # synchronously below so worker threads are reserved for
+    # network-bound URLs. Any requester's cache file satisfies the URL.
+    cached_tasks: list[tuple[str, str]] = []
+    fetch_tasks: list[str] = []
+    for url, requesters in url_requests.items():
+        existing = next(
+            (path for _, path in requesters if os.path.exists(path)), None
+        )
+        if existing is not None:
+            cached_tasks.append((url, existing))
+        else:
+            fetch_tasks.append(url)
 
+    # Cache writes go through a single background thread so the disk
+    # IO overlaps with the per-host politeness delay instead of
+    # occupying a crawl worker.
+    writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    # Helper function for one url
+    def _process_url(url: str) -> tuple[str, str, str]:
+        """Returns (url, html, status_msg)"""
         try:
+            # Polite per-host spacing; other hosts proceed in parallel
+            _throttle_host(url, delay)
             html = fetch_page_html(url)
-            with open(cache_path, "w", encoding="utf-8") as fh:
-                fh.write(html)
-            
-            # Polite delay between requests on this thread
-            time.sleep(delay)
-            return template, url, html, "fetched"
+            for _, cache_path in url_requests[url]:
+                writer.submit(
+                    Path(cache_path).write_text, html, encoding="utf-8"
+                )
+            return url, html, "fetched"
         except requests.RequestException as exc:
-            return template, url, "", f"error: {exc}"
+            return url, "", f"error: {exc}"
 
     progress = Progress(
         SpinnerColumn(),
@@ -154,33 +245,65 @@ def crawl_pages(
     )
     
     with progress:
-        task_id = progress.add_task("[cyan]Crawling pages...", total=total_urls)
-        
+        task_id = progress.add_task(
+            "[cyan]Crawling pages...", total=len(url_requests)
+        )
+
+        # Refreshing the description re-renders the whole progress line,
+        # which is measurable at high completion rates; only every Kth
+        # completion gets a new description while the bar always ticks.
+        description_interval = 5
+        completed = 0
+
+        # Cache hits: plain file reads, no executor involved
+        for url, cache_path in cached_tasks:
+            _fan_out(url, Path(cache_path).read_text(encoding="utf-8"))
+            completed += 1
+            if completed % description_interval == 0:
+                short_url = url if len(url) < 40 else f"...{url[-37:]}"
+                progress.update(
+                    task_id,
+                    advance=1,
+                    description=f"[cyan]Crawling pages... [dim]{short_url}[/]",
+                )
+            else:
+                progress.update(task_id, advance=1)
+
+        if not fetch_tasks:
+            writer.shutdown(wait=False)
+            return results
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_url = {
-                executor.submit(_process_url, t, u): (t, u)
-                for (t, u) in tasks
+                executor.submit(_process_url, url): url
+                for url in fetch_tasks
             }
-            
+
             for future in concurrent.futures.as_completed(future_to_url):
-                template, url = future_to_url[future]
+                url = future_to_url[future]
                 try:
-                    tmpl, u, html, status = future.result()
-                    results[tmpl][u] = html
-                    
-                    # Update progress description with the latest processed URL
-                    # but keep it brief to avoid terminal spam
-                    short_url = url if len(url) < 40 else f"...{url[-37:]}"
-                    color = "green" if status == "fetched" else ("dim" if status == "cached" else "red")
-                    
+                    u, html, status = future.result()
+                    _fan_out(u, html)
+
                     if console and status.startswith("error"):
                         console.print(f"  [red]Failed:[/] {url} ({status})")
-                        
-                    progress.update(task_id, advance=1, description=f"[cyan]Crawling pages... [{color}]{short_url}[/]")
+
+                    # Update the description with the latest processed
+                    # URL only every few completions to avoid spamming
+                    # terminal re-renders; the bar itself always ticks.
+                    completed += 1
+                    if completed % description_interval == 0 or status.startswith("error"):
+                        short_url = url if len(url) < 40 else f"...{url[-37:]}"
+                        color = "green" if status == "fetched" else ("dim" if status == "cached" else "red")
+                        progress.update(task_id, advance=1, description=f"[cyan]Crawling pages... [{color}]{short_url}[/]")
+                    else:
+                        progress.update(task_id, advance=1)
                 except Exception as exc:
-                    results[template][url] = ""
+                    _fan_out(url, "")
                     if console:
                         console.print(f"  [red]Error processing {url}: {exc}[/]")
                     progress.update(task_id, advance=1)
 
+    # Flush pending cache writes before returning
+    writer.shutdown(wait=True)
     return results
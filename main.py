@@ -26,10 +26,11 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
-from analyzer import PageAnalysis, analyze_page
+from analyzer import PageAnalysis, analyze_pages
 from crawler import crawl_pages
 from reporter import (
     aggregate_findings,
+    build_report_dict,
     print_findings_report,
     print_page_summary,
     print_scope_summary,
@@ -229,19 +230,33 @@ def main() -> int:
         )
         with progress:
             task_id = progress.add_task("[cyan]Analyzing...", total=total_pages_to_analyze)
+
+            # Flatten to one batch so the analysis fans out across a
+            # process pool; empty fetches just tick the bar.
+            flat_tasks: list[tuple[str, str, str]] = []
             for template, url_html_map in crawled.items():
                 analyses[template] = []
                 for url, html in url_html_map.items():
-                    short_url = url if len(url) < 40 else f"...{url[-37:]}"
-                    progress.update(task_id, description=f"[cyan]Analyzing [dim]{short_url}[/]")
-                    
                     if not html:
                         progress.update(task_id, advance=1)
-                        continue
-                        
-                    analysis = analyze_page(url, html)
-                    analyses[template].append(analysis)
-                    progress.update(task_id, advance=1)
+                    else:
+                        flat_tasks.append((template, url, html))
+
+            def _on_result(analysis: PageAnalysis) -> None:
+                url = analysis.url
+                short_url = url if len(url) < 40 else f"...{url[-37:]}"
+                progress.update(
+                    task_id,
+                    advance=1,
+                    description=f"[cyan]Analyzing [dim]{short_url}[/]",
+                )
+
+            results = analyze_pages(
+                [(url, html) for _, url, html in flat_tasks],
+                on_result=_on_result,
+            )
+            for (template, _, _), analysis in zip(flat_tasks, results):
+                analyses[template].append(analysis)
     else:
         console.print("[yellow]No pages to analyze.[/]")
 
@@ -265,8 +280,11 @@ def main() -> int:
         show_secondary=not args.no_secondary,
     )
 
+    # Build the serializable report once; both writers consume it.
+    report = build_report_dict(analyses, aggregated)
+
     # JSON report
-    write_json_report(analyses, aggregated, args.output)
+    write_json_report(analyses, aggregated, args.output, report=report)
     console.print()
     console.print(
         f"[green]✅ JSON report written to:[/] [bold]{args.output}[/]"
@@ -276,7 +294,7 @@ def main() -> int:
     excel_path = args.excel or args.output.replace('.json', '.xlsx')
     if not excel_path.endswith('.xlsx'):
         excel_path += '.xlsx'
-    write_excel_report(analyses, aggregated, excel_path)
+    write_excel_report(analyses, aggregated, excel_path, report=report)
     console.print(
         f"[green]✅ Excel report written to:[/] [bold]{excel_path}[/]"
     )
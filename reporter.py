@@ -5,11 +5,16 @@ template-wide vs. page-specific), and outputs results as both a
 rich terminal table and a JSON file.
 """
 
-import json
+import copy
+import operator
 import os
 from collections import defaultdict
+from functools import lru_cache
 from typing import Optional
 
+import orjson
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -17,10 +22,47 @@ from rich.text import Text
 
 from analyzer import Finding, PageAnalysis
 
+# Bound method hoisted once: each _clean_str call dispatches straight
+# to the compiled pattern instead of resolving .sub per invocation.
+_CLEAN = ILLEGAL_CHARACTERS_RE.sub
+
+
+@lru_cache(maxsize=1)
+def _excel_styles():
+    """Import and build the shared Excel style objects once.
+
+    openpyxl.styles is only needed when an Excel report is actually
+    written; caching keeps the imports and style construction out of
+    module import time and off repeat calls.
+    """
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(
+        start_color="366092", end_color="366092", fill_type="solid"
+    )
+    wrap_alignment = Alignment(wrap_text=True, vertical="top")
+    return header_font, header_fill, wrap_alignment, get_column_letter
+
+
+@lru_cache(maxsize=8192)
+def _clean_str(val: str) -> str:
+    """Strip characters openpyxl refuses to write.
+
+    Cached because the same snippets and identifiers repeat across
+    findings for shared elements; repeat values skip the regex pass.
+    """
+    return _CLEAN("", val)
+
 
+@lru_cache(maxsize=4096)
 def _format_bytes(size_bytes: int) -> str:
     """Format byte count as a human-readable string.
 
+    Cached: shared findings repeat the same sizes across summary,
+    scope, and findings tables, so duplicates skip the formatting.
+
     Args:
         size_bytes: Number of bytes.
 
@@ -49,6 +91,33 @@ def _fingerprint(finding: Finding) -> str:
     return f"{finding.element_type}::{finding.element_identifier}"
 
 
+class _Group:
+    """Accumulator for findings that share a fingerprint.
+
+    A __slots__ class instead of a per-fingerprint dict: attribute
+    reads beat string-keyed lookups in the per-finding hot loop, and
+    defaultdict can call the class directly as its factory.
+    """
+
+    __slots__ = (
+        "finding", "pages_mask", "templates_mask", "template",
+        "total_size", "count",
+    )
+
+    def __init__(self):
+        self.finding: Optional[Finding] = None
+        # Membership as bitmasks over small URL/template ids: |= and
+        # == are single bigint ops instead of hash-set inserts and
+        # compares.
+        self.pages_mask = 0
+        self.templates_mask = 0
+        # Most recent template seen; when templates_mask has a single
+        # bit set this IS the single template.
+        self.template = ""
+        self.total_size = 0
+        self.count = 0
+
+
 def aggregate_findings(
     analyses: dict[str, list[PageAnalysis]],
 ) -> list[Finding]:
@@ -69,85 +138,128 @@ def aggregate_findings(
         sorted by total size descending.
     """
     # Group findings by fingerprint
-    grouped: dict[str, dict] = defaultdict(lambda: {
-        "finding": None,
-        "pages": set(),
-        "templates": set(),
-        "total_size": 0,
-        "count": 0,
-    })
+    grouped: dict[str, _Group] = defaultdict(_Group)
 
-    all_urls = set()
-    template_urls: dict[str, set[str]] = defaultdict(set)
+    # Map each URL to a small integer id so page membership can be
+    # tracked as an int bitmask: one machine word up to 64 URLs, and
+    # still C-level bigint ops beyond that.
+    url_to_id: dict[str, int] = {}
+    template_masks: dict[str, int] = {}
 
-    for template, page_analyses in analyses.items():
+    for template_id, (template, page_analyses) in enumerate(analyses.items()):
+        template_bit = 1 << template_id
+        template_mask = 0
         for analysis in page_analyses:
-            all_urls.add(analysis.url)
-            template_urls[template].add(analysis.url)
+            url_id = url_to_id.setdefault(analysis.url, len(url_to_id))
+            url_bit = 1 << url_id
+            template_mask |= url_bit
 
             for finding in analysis.findings:
                 fp = _fingerprint(finding)
                 entry = grouped[fp]
 
-                if entry["finding"] is None:
-                    entry["finding"] = Finding(
-                        element_type=finding.element_type,
-                        element_identifier=finding.element_identifier,
-                        description=finding.description,
-                        visibility=finding.visibility,
-                        size_bytes=finding.size_bytes,
-                        percent_of_page=finding.percent_of_page,
-                        priority=finding.priority,
-                        searchable_snippet=finding.searchable_snippet,
-                    )
-
-                entry["pages"].add(analysis.url)
-                entry["templates"].add(template)
-                entry["total_size"] = max(
-                    entry["total_size"], finding.size_bytes
-                )
-                entry["count"] += 1
-
-    # Determine scope for each grouped finding
+                if entry.finding is None:
+                    # Keep a reference to the first occurrence instead of
+                    # copying it: all occurrences share the descriptive
+                    # fields, and the aggregate-only fields (scope,
+                    # pages_found_on, size_bytes) are rebuilt in the
+                    # second pass anyway.
+                    entry.finding = finding
+
+                entry.pages_mask |= url_bit
+                entry.templates_mask |= template_bit
+                entry.template = template
+                if finding.size_bytes > entry.total_size:
+                    entry.total_size = finding.size_bytes
+                entry.count += 1
+        template_masks[template] = template_mask
+
+    # Size counts are loop-invariant across the scope pass; compute
+    # them once rather than re-counting per grouped finding.
+    n_all = len(url_to_id)
+    all_mask = (1 << n_all) - 1
+    urls_by_id = list(url_to_id)
+
+    # Determine scope for each grouped finding. One shallow copy per
+    # unique fingerprint keeps the per-page Finding objects (still
+    # referenced from PageAnalysis.findings) untouched by the
+    # aggregate-level mutations below.
     aggregated = []
     for fp, entry in grouped.items():
-        finding = entry["finding"]
-        pages = entry["pages"]
-        templates = entry["templates"]
-
+        finding = copy.copy(entry.finding)
+        pages_mask = entry.pages_mask
+        n_pages = pages_mask.bit_count()
+
+        # Expand the mask back to URLs only for the output list
+        pages = []
+        remaining = pages_mask
+        while remaining:
+            low = remaining & -remaining
+            pages.append(urls_by_id[low.bit_length() - 1])
+            remaining ^= low
         finding.pages_found_on = sorted(pages)
-        finding.size_bytes = entry["total_size"]
+        if n_pages > 1:
+            finding.pages_joined = "\n".join(finding.pages_found_on)
+        elif pages:
+            finding.pages_joined = pages[0]
+        finding.size_bytes = entry.total_size
 
         # Determine scope
-        if len(pages) == len(all_urls) and len(all_urls) > 1:
+        if pages_mask == all_mask and n_all > 1:
             finding.scope = "site-wide"
-        elif len(templates) == 1:
-            template_name = next(iter(templates))
-            tmpl_urls = template_urls[template_name]
-            if len(pages) == len(tmpl_urls) and len(tmpl_urls) > 1:
+        elif entry.templates_mask.bit_count() == 1:
+            template_name = entry.template
+            template_mask = template_masks[template_name]
+            if pages_mask == template_mask and n_pages > 1:
                 finding.scope = f"template-wide ({template_name})"
-            elif len(pages) > 1:
+            elif n_pages > 1:
                 finding.scope = f"multi-page ({template_name})"
             else:
                 finding.scope = "page-specific"
-        elif len(pages) > 1:
+        elif n_pages > 1:
             finding.scope = "multi-page (cross-template)"
         else:
             finding.scope = "page-specific"
 
+        finding._sort_key = (
+            0 if finding.priority == "primary" else 1,
+            -finding.size_bytes,
+        )
         aggregated.append(finding)
 
-    # Sort: primary first, then by size descending
-    aggregated.sort(
-        key=lambda f: (
-            0 if f.priority == "primary" else 1,
-            -f.size_bytes,
-        )
-    )
+    # Sort: primary first, then by size descending. The key tuples
+    # were precomputed above, so the sort dispatches through a C-level
+    # attrgetter instead of a Python lambda per element.
+    aggregated.sort(key=operator.attrgetter("_sort_key"))
 
     return aggregated
 
 
+def _split_by_priority(
+    aggregated_findings: list[Finding],
+) -> tuple[list[Finding], list[Finding]]:
+    """Split an aggregated findings list into (primary, secondary).
+
+    Relies on the sort order produced by aggregate_findings: all
+    primary findings precede secondary ones, so a single scan for the
+    boundary replaces two full filter passes.
+
+    Args:
+        aggregated_findings: Findings sorted primary-first.
+
+    Returns:
+        A (primary, secondary) pair of list slices.
+    """
+    split = next(
+        (
+            i for i, f in enumerate(aggregated_findings)
+            if f.priority != "primary"
+        ),
+        len(aggregated_findings),
+    )
+    return aggregated_findings[:split], aggregated_findings[split:]
+
+
 def print_page_summary(
     analyses: dict[str, list[PageAnalysis]],
     console: Optional[Console] = None,
@@ -209,8 +321,7 @@ def print_findings_report(
         console = Console()
 
     # Separate primary and secondary
-    primary = [f for f in aggregated_findings if f.priority == "primary"]
-    secondary = [f for f in aggregated_findings if f.priority == "secondary"]
+    primary, secondary = _split_by_priority(aggregated_findings)
 
     # --- Primary findings table ---
     console.print()
@@ -241,8 +352,6 @@ def print_findings_report(
                 "👁️ Yes" if finding.visibility == "user-visible"
                 else "⚙️ No"
             )
-            pages_str = "\n".join(finding.pages_found_on)
-
             table.add_row(
                 finding.element_identifier,
                 finding.description,
@@ -250,7 +359,7 @@ def print_findings_report(
                 _format_bytes(finding.size_bytes),
                 f"{finding.percent_of_page:.1f}%",
                 finding.scope,
-                pages_str,
+                finding.pages_joined or "\n".join(finding.pages_found_on),
             )
 
         console.print(table)
@@ -285,31 +394,36 @@ def print_findings_report(
                 "👁️ Yes" if finding.visibility == "user-visible"
                 else "⚙️ No"
             )
-            pages_str = "\n".join(finding.pages_found_on)
-
             table.add_row(
                 finding.element_identifier,
                 finding.description,
                 vis_icon,
                 finding.scope,
-                pages_str,
+                finding.pages_joined or "\n".join(finding.pages_found_on),
             )
 
         console.print(table)
 
 
-def write_json_report(
+def build_report_dict(
     analyses: dict[str, list[PageAnalysis]],
     aggregated_findings: list[Finding],
-    output_path: str,
-) -> None:
-    """Write the full report as a JSON file.
+) -> dict:
+    """Build the JSON-serializable report shared by all writers.
+
+    Both write_json_report and write_excel_report consume the same
+    structure; building it once and passing it to both avoids running
+    every to_dict() call twice when both outputs are requested.
 
     Args:
         analyses: Dict mapping template key -> list of PageAnalysis.
         aggregated_findings: List of aggregated Finding objects.
-        output_path: Path for the JSON output file.
+
+    Returns:
+        The report dict with "summary", "pages", and
+        "aggregated_findings" keys.
     """
+    primary, secondary = _split_by_priority(aggregated_findings)
     report = {
         "summary": {
             "total_pages_analyzed": sum(
@@ -319,16 +433,8 @@ def write_json_report(
         },
         "pages": {},
         "aggregated_findings": {
-            "primary": [
-                f.to_dict()
-                for f in aggregated_findings
-                if f.priority == "primary"
-            ],
-            "secondary": [
-                f.to_dict()
-                for f in aggregated_findings
-                if f.priority == "secondary"
-            ],
+            "primary": [f.to_dict() for f in primary],
+            "secondary": [f.to_dict() for f in secondary],
         },
     }
 
@@ -337,15 +443,38 @@ def write_json_report(
             pa.to_dict() for pa in page_analyses
         ]
 
+    return report
+
+
+def write_json_report(
+    analyses: dict[str, list[PageAnalysis]],
+    aggregated_findings: list[Finding],
+    output_path: str,
+    report: Optional[dict] = None,
+) -> None:
+    """Write the full report as a JSON file.
+
+    Args:
+        analyses: Dict mapping template key -> list of PageAnalysis.
+        aggregated_findings: List of aggregated Finding objects.
+        output_path: Path for the JSON output file.
+        report: Optional precomputed report from build_report_dict.
+    """
+    if report is None:
+        report = build_report_dict(analyses, aggregated_findings)
+
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as fh:
-        json.dump(report, fh, indent=2, ensure_ascii=False)
+    # orjson serializes in C and emits UTF-8 bytes directly; indented
+    # output stays human-readable like json.dump(indent=2) was.
+    with open(output_path, "wb") as fh:
+        fh.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
 
 
 def write_excel_report(
     analyses: dict[str, list[PageAnalysis]],
     aggregated_findings: list[Finding],
     output_path: str,
+    report: Optional[dict] = None,
 ) -> None:
     """Write the full report as an Excel file.
 
@@ -353,41 +482,23 @@ def write_excel_report(
         analyses: Dict mapping template key -> list of PageAnalysis.
         aggregated_findings: List of aggregated Finding objects.
         output_path: Path for the Excel output file.
+        report: Optional precomputed report from build_report_dict.
     """
-    import pandas as pd
-    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    # Nothing to report: skip the openpyxl import and workbook setup
+    if not analyses:
+        return
 
-    def _clean_str(val):
-        if isinstance(val, str):
-            return ILLEGAL_CHARACTERS_RE.sub("", val)
-        return val
+    import openpyxl
 
-    report = {
-        "summary": {
-            "total_pages_analyzed": sum(
-                len(pa) for pa in analyses.values()
-            ),
-            "templates_found": list(analyses.keys()),
-        },
-        "pages": {},
-        "aggregated_findings": {
-            "primary": [
-                f.to_dict()
-                for f in aggregated_findings
-                if f.priority == "primary"
-            ],
-            "secondary": [
-                f.to_dict()
-                for f in aggregated_findings
-                if f.priority == "secondary"
-            ],
-        },
-    }
+    if report is None:
+        report = build_report_dict(analyses, aggregated_findings)
 
-    for template, page_analyses in analyses.items():
-        report["pages"][template] = [
-            pa.to_dict() for pa in page_analyses
-        ]
+    # Rows are plain tuples in the fixed column order below: one
+    # allocation per row instead of a page-info dict copied and
+    # updated per finding, and ws.append takes them directly. The
+    # schema is static, so only the known string columns go through
+    # _clean_str — numeric cells skip the per-value type check the
+    # old dict-based cleaner paid.
 
     # --- TAB 1: Process Page Findings ---
     page_rows = []
@@ -396,133 +507,168 @@ def write_excel_report(
     if "pages" in report:
         for template_name, pages_list in report["pages"].items():
             for page in pages_list:
-                page_info = {
-                    "Template": template_name,
-                    "URL": page.get("url"),
-                    "Total HTML Bytes": page.get("total_html_bytes"),
-                    "Total HTML KB": page.get("total_html_kb"),
-                    "Total Flagged Bytes": page.get("total_flagged_bytes"),
-                    "Flagged Percent": page.get("flagged_percent"),
-                    "Findings Count": page.get("findings_count")
-                }
-                
+                page_prefix = (
+                    template_name,
+                    page.get("url"),
+                    page.get("total_html_bytes"),
+                    page.get("total_html_kb"),
+                    page.get("total_flagged_bytes"),
+                    page.get("flagged_percent"),
+                    page.get("findings_count"),
+                )
+
                 findings = page.get("findings", [])
                 if not findings:
-                    page_rows.append(page_info)
+                    page_rows.append(page_prefix + (None,) * 10)
                 else:
                     for finding in findings:
-                        row = page_info.copy()
-                        row.update({
-                            "Element Type": _clean_str(finding.get("element_type")),
-                            "Element Identifier": _clean_str(finding.get("element_identifier")),
-                            "Description": _clean_str(finding.get("description")),
-                            "Visibility": _clean_str(finding.get("visibility")),
-                            "Size (Bytes)": finding.get("size_bytes"),
-                            "Percent of Page": finding.get("percent_of_page"),
-                            "Priority": _clean_str(finding.get("priority")),
-                            "Scope": _clean_str(finding.get("scope")),
-                            "Pages Found On": _clean_str(", ".join(finding.get("pages_found_on", []))),
-                            "Snippet": _clean_str(finding.get("searchable_snippet"))
-                        })
-                        page_rows.append(row)
+                        page_rows.append(page_prefix + (
+                            _clean_str(finding["element_type"]),
+                            _clean_str(finding["element_identifier"]),
+                            _clean_str(finding["description"]),
+                            _clean_str(finding["visibility"]),
+                            finding.get("size_bytes"),
+                            finding.get("percent_of_page"),
+                            _clean_str(finding["priority"]),
+                            _clean_str(finding["scope"]),
+                            _clean_str(", ".join(finding["pages_found_on"])),
+                            _clean_str(finding["searchable_snippet"]),
+                        ))
 
                         # Capture json-nodes for the Large JS Payloads tab
                         if finding.get("element_type") == "json-node":
-                            js_payload_rows.append({
-                                "URL": page.get("url"),
-                                "Template": template_name,
-                                "Element Identifier": _clean_str(finding.get("element_identifier")),
-                                "Description": _clean_str(finding.get("description")),
-                                "Size (Bytes)": finding.get("size_bytes"),
-                                "Percent of Page": finding.get("percent_of_page"),
-                                "Snippet": _clean_str(finding.get("searchable_snippet"))
-                            })
-
-    df_pages = pd.DataFrame(page_rows)
-    df_js_payloads = pd.DataFrame(js_payload_rows)
+                            js_payload_rows.append((
+                                page.get("url"),
+                                template_name,
+                                _clean_str(finding["element_identifier"]),
+                                _clean_str(finding["description"]),
+                                finding.get("size_bytes"),
+                                finding.get("percent_of_page"),
+                                _clean_str(finding["searchable_snippet"]),
+                            ))
 
     # --- TAB 2: Process Aggregated Findings ---
     agg_rows = []
 
     if "aggregated_findings" in report:
         for category, findings_list in report["aggregated_findings"].items():
+            category_label = _clean_str(category.capitalize())
             for finding in findings_list:
-                row = {
-                    "Category": _clean_str(category.capitalize()),
-                    "Element Type": _clean_str(finding.get("element_type")),
-                    "Element Identifier": _clean_str(finding.get("element_identifier")),
-                    "Description": _clean_str(finding.get("description")),
-                    "Visibility": _clean_str(finding.get("visibility")),
-                    "Size (Bytes)": finding.get("size_bytes"),
-                    "Percent of Page": finding.get("percent_of_page"),
-                    "Priority": _clean_str(finding.get("priority")),
-                    "Scope": _clean_str(finding.get("scope")),
-                    "Pages Found On": _clean_str(", ".join(finding.get("pages_found_on", []))),
-                    "Snippet": _clean_str(finding.get("searchable_snippet"))
-                }
-                agg_rows.append(row)
-
-    df_agg = pd.DataFrame(agg_rows)
+                agg_rows.append((
+                    category_label,
+                    _clean_str(finding["element_type"]),
+                    _clean_str(finding["element_identifier"]),
+                    _clean_str(finding["description"]),
+                    _clean_str(finding["visibility"]),
+                    finding.get("size_bytes"),
+                    finding.get("percent_of_page"),
+                    _clean_str(finding["priority"]),
+                    _clean_str(finding["scope"]),
+                    _clean_str(", ".join(finding["pages_found_on"])),
+                    _clean_str(finding["searchable_snippet"]),
+                ))
+
+    # Write-only mode streams rows straight to disk: no DataFrame
+    # copy of the rows, and column widths/cell styles are applied in
+    # the same pass that emits each row instead of a second full-sheet
+    # traversal afterwards.
+    from openpyxl.cell import WriteOnlyCell
+
+    header_font, header_fill, wrap_alignment, get_column_letter = (
+        _excel_styles()
+    )
+
+    # Columns whose cells get word wrapping
+    wrap_columns = frozenset((
+        "Snippet", "Element Identifier", "Pages Found On", "URL", "Description"
+    ))
+
+    def _write_sheet(ws, columns: tuple, rows: list) -> None:
+        """Stream one sheet: widths and header row, then data rows."""
+        # Sheet properties must all be set before the first append in
+        # write-only mode (anything later is silently dropped): freeze
+        # the header row, add a filter dropdown, and size the columns.
+        # rows is fully materialized, so the widths are known up front.
+        ws.freeze_panes = "A2"
+        ws.auto_filter.ref = (
+            f"A1:{get_column_letter(len(columns))}{len(rows) + 1}"
+        )
+
+        max_lens = [len(name) for name in columns]
+        for row in rows:
+            for idx, value in enumerate(row):
+                if value is not None:
+                    length = len(str(value))
+                    if length > max_lens[idx]:
+                        max_lens[idx] = length
+        # Cap the maximum width to keep things readable, minimum width 10
+        for idx, max_len in enumerate(max_lens, 1):
+            width = max(min(max_len + 2, 50), 10)
+            ws.column_dimensions[get_column_letter(idx)].width = width
+
+        header_cells = []
+        for name in columns:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.font = header_font
+            cell.fill = header_fill
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Per-column style decided once from the header name
+        number_formats = [
+            "#,##0" if "Bytes" in name
+            else "0.0" if "Percent" in name
+            else None
+            for name in columns
+        ]
+        wraps = [name in wrap_columns for name in columns]
+
+        for row in rows:
+            cells = []
+            for idx, value in enumerate(row):
+                if number_formats[idx] is None and not wraps[idx]:
+                    cells.append(value)
+                    continue
+                cell = WriteOnlyCell(ws, value=value)
+                if number_formats[idx] is not None:
+                    cell.number_format = number_formats[idx]
+                if wraps[idx]:
+                    cell.alignment = wrap_alignment
+                cells.append(cell)
+            ws.append(cells)
+
+    page_columns = (
+        "Template", "URL", "Total HTML Bytes", "Total HTML KB",
+        "Total Flagged Bytes", "Flagged Percent", "Findings Count",
+        "Element Type", "Element Identifier", "Description", "Visibility",
+        "Size (Bytes)", "Percent of Page", "Priority", "Scope",
+        "Pages Found On", "Snippet",
+    )
+    agg_columns = (
+        "Category", "Element Type", "Element Identifier", "Description",
+        "Visibility", "Size (Bytes)", "Percent of Page", "Priority",
+        "Scope", "Pages Found On", "Snippet",
+    )
+    js_columns = (
+        "URL", "Template", "Element Identifier", "Description",
+        "Size (Bytes)", "Percent of Page", "Snippet",
+    )
 
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        df_pages.to_excel(writer, sheet_name='Page Findings', index=False)
-        df_agg.to_excel(writer, sheet_name='Aggregated Findings', index=False)
-        if not df_js_payloads.empty:
-            df_js_payloads.to_excel(writer, sheet_name='Large JS Payloads', index=False)
-
-        # Apply rich styling to make it user-friendly
-        from openpyxl.styles import Font, PatternFill, Alignment
-        from openpyxl.utils import get_column_letter
-
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(
-            start_color="366092", end_color="366092", fill_type="solid"
+    workbook = openpyxl.Workbook(write_only=True)
+    _write_sheet(
+        workbook.create_sheet("Page Findings"), page_columns, page_rows
+    )
+    _write_sheet(
+        workbook.create_sheet("Aggregated Findings"), agg_columns, agg_rows
+    )
+    if js_payload_rows:
+        _write_sheet(
+            workbook.create_sheet("Large JS Payloads"),
+            js_columns,
+            js_payload_rows,
         )
-        wrap_alignment = Alignment(wrap_text=True, vertical="top")
-
-        for sheet_name in writer.sheets:
-            worksheet = writer.sheets[sheet_name]
-            
-            # Freeze the header row and add a filter dropdown to it
-            worksheet.freeze_panes = 'A2'
-            worksheet.auto_filter.ref = worksheet.dimensions
-
-            for col_idx, column in enumerate(worksheet.columns, 1):
-                col_letter = get_column_letter(col_idx)
-                header_cell = column[0]
-                header_val = str(header_cell.value) if header_cell.value else ""
-
-                # Style header
-                header_cell.font = header_font
-                header_cell.fill = header_fill
-
-                # Determine optimal column width
-                max_length = 0
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                # Cap the maximum width to keep things readable, minimum width 10
-                adjusted_width = max(min(max_length + 2, 50), 10)
-                worksheet.column_dimensions[col_letter].width = adjusted_width
-
-                # Formatting data cells based on column name
-                for cell in column[1:]:
-                    if "Bytes" in header_val:
-                        cell.number_format = '#,##0'  # Comma separated
-                    
-                    if "Percent" in header_val:
-                        cell.number_format = '0.0'    # 1 decimal place
-                        
-                    # Enable word wrapping for wordy columns
-                    if header_val in (
-                        "Snippet", "Element Identifier", "Pages Found On", "URL", "Description"
-                    ):
-                        cell.alignment = wrap_alignment
+    workbook.save(output_path)
 
 
 def print_scope_summary(
@@ -538,14 +684,17 @@ def print_scope_summary(
     if console is None:
         console = Console()
 
-    site_wide = [
-        f for f in aggregated_findings
-        if f.scope == "site-wide" and f.priority == "primary"
-    ]
-    template_wide = [
-        f for f in aggregated_findings
-        if "template-wide" in f.scope and f.priority == "primary"
-    ]
+    # Single pass, stopping at the first secondary finding: the
+    # aggregate sort puts all primary findings first.
+    site_wide: list[Finding] = []
+    template_wide: list[Finding] = []
+    for f in aggregated_findings:
+        if f.priority != "primary":
+            break
+        if f.scope == "site-wide":
+            site_wide.append(f)
+        elif f.scope.startswith("template-wide"):
+            template_wide.append(f)
 
     if site_wide:
         total_site_bytes = sum(f.size_bytes for f in site_wide)
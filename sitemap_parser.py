@@ -5,6 +5,9 @@ groups them by page template (first path segment), and selects
 sample URLs for analysis.
 """
 
+import concurrent.futures
+import functools
+import io
 import random
 import re
 from collections import defaultdict
@@ -12,7 +15,7 @@ from typing import Optional
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -35,6 +38,23 @@ DEFAULT_HEADERS = {
 # Maximum number of child sitemaps to follow from a sitemap index.
 MAX_CHILD_SITEMAPS = 50
 
+# Bound search method of a precompiled pattern: get_template_key runs
+# per path segment per URL, so skip re.search's cache lookup and
+# pattern re-validation on every call.
+_HAS_DIGIT = re.compile(r"\d").search
+
+# Number of child sitemaps fetched concurrently from a sitemap index.
+CHILD_FETCH_WORKERS = 8
+
+# Shared session so child-sitemap fetches reuse TCP+TLS connections
+# across the worker threads instead of handshaking per request.
+SESSION = requests.Session()
+_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_connections=CHILD_FETCH_WORKERS, pool_maxsize=CHILD_FETCH_WORKERS
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
 
 def fetch_sitemap_xml(
     url: str,
@@ -54,7 +74,7 @@ def fetch_sitemap_xml(
     Raises:
         requests.HTTPError: If the response status is not 2xx.
     """
-    resp = requests.get(
+    resp = SESSION.get(
         url,
         headers=headers or DEFAULT_HEADERS,
         timeout=timeout,
@@ -63,6 +83,48 @@ def fetch_sitemap_xml(
     return resp.text
 
 
+def _parse_sitemap(xml_content: str) -> tuple[bool, list[str]]:
+    """Stream-parse a sitemap in one pass.
+
+    lxml's iterparse walks the document in C and hands back only the
+    elements we care about, so there is no full soup tree and the
+    index check shares the same pass as URL extraction.
+
+    Args:
+        xml_content: Raw XML string of a sitemap or sitemap index.
+
+    Returns:
+        A (is_index, urls) tuple: whether the document is a
+        <sitemapindex>, and all <loc> URLs found in it.
+    """
+    stream = io.BytesIO(xml_content.encode("utf-8"))
+    is_index = False
+    urls: list[str] = []
+    try:
+        for _, element in etree.iterparse(
+            stream, events=("end",), recover=True
+        ):
+            # Namespace-agnostic local name: sitemaps may or may not
+            # declare the sitemaps.org namespace.
+            tag = (
+                element.tag.rpartition("}")[2]
+                if isinstance(element.tag, str)
+                else ""
+            )
+            if tag == "loc":
+                text = element.text
+                if text:
+                    urls.append(text.strip())
+                element.clear()
+            elif tag == "sitemapindex":
+                is_index = True
+    except etree.XMLSyntaxError:
+        # Empty or hopelessly malformed document: return whatever
+        # was extracted before the parser gave up.
+        pass
+    return is_index, urls
+
+
 def extract_urls_from_xml(xml_content: str) -> list[str]:
     """Extract all <loc> URLs from a single sitemap XML document.
 
@@ -72,8 +134,7 @@ def extract_urls_from_xml(xml_content: str) -> list[str]:
     Returns:
         A list of URL strings found in <loc> elements.
     """
-    soup = BeautifulSoup(xml_content, "lxml-xml")
-    return [loc.get_text(strip=True) for loc in soup.find_all("loc")]
+    return _parse_sitemap(xml_content)[1]
 
 
 def is_sitemap_index(xml_content: str) -> bool:
@@ -85,8 +146,7 @@ def is_sitemap_index(xml_content: str) -> bool:
     Returns:
         True if this is a <sitemapindex> document.
     """
-    soup = BeautifulSoup(xml_content, "lxml-xml")
-    return soup.find("sitemapindex") is not None
+    return _parse_sitemap(xml_content)[0]
 
 
 def fetch_all_urls(sitemap_url: str, console=None) -> list[str]:
@@ -107,8 +167,11 @@ def fetch_all_urls(sitemap_url: str, console=None) -> list[str]:
 
     xml_content = fetch_sitemap_xml(sitemap_url)
 
-    if is_sitemap_index(xml_content):
-        child_urls = extract_urls_from_xml(xml_content)
+    # One streaming pass yields both the index flag and the URLs.
+    is_index, root_urls = _parse_sitemap(xml_content)
+
+    if is_index:
+        child_urls = root_urls
         if console:
             console.print(
                 f"[yellow]Sitemap index found with "
@@ -117,7 +180,10 @@ def fetch_all_urls(sitemap_url: str, console=None) -> list[str]:
 
         all_page_urls = []
         urls_to_fetch = child_urls[:MAX_CHILD_SITEMAPS]
-        
+
+        # Each child fetch blocks on a network round trip, so overlap
+        # them: wall time becomes roughly ceil(N / workers) RTTs
+        # instead of N.
         if console and urls_to_fetch:
             progress = Progress(
                 SpinnerColumn(),
@@ -131,35 +197,54 @@ def fetch_all_urls(sitemap_url: str, console=None) -> list[str]:
             )
             with progress:
                 task_id = progress.add_task("[cyan]Fetching child sitemaps...", total=len(urls_to_fetch))
-                for child_url in urls_to_fetch:
-                    short_url = child_url if len(child_url) < 40 else f"...{child_url[-37:]}"
-                    progress.update(task_id, description=f"[cyan]Fetching child [dim]{short_url}[/]")
-                    
-                    try:
-                        child_xml = fetch_sitemap_xml(child_url)
-                        all_page_urls.extend(extract_urls_from_xml(child_xml))
-                    except requests.RequestException as exc:
-                        console.print(f"  [red]Failed to fetch {child_url}: {exc}[/]")
-                    progress.update(task_id, advance=1)
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=CHILD_FETCH_WORKERS
+                ) as executor:
+                    future_to_url = {
+                        executor.submit(fetch_sitemap_xml, child_url): child_url
+                        for child_url in urls_to_fetch
+                    }
+                    for future in concurrent.futures.as_completed(future_to_url):
+                        child_url = future_to_url[future]
+                        short_url = child_url if len(child_url) < 40 else f"...{child_url[-37:]}"
+                        try:
+                            all_page_urls.extend(
+                                extract_urls_from_xml(future.result())
+                            )
+                            progress.update(task_id, description=f"[cyan]Fetching child [dim]{short_url}[/]")
+                        except requests.RequestException as exc:
+                            console.print(f"  [red]Failed to fetch {child_url}: {exc}[/]")
+                        progress.update(task_id, advance=1)
         else:
-            for child_url in urls_to_fetch:
-                try:
-                    child_xml = fetch_sitemap_xml(child_url)
-                    all_page_urls.extend(extract_urls_from_xml(child_xml))
-                except requests.RequestException:
-                    pass
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=CHILD_FETCH_WORKERS
+            ) as executor:
+                for future in concurrent.futures.as_completed(
+                    executor.submit(fetch_sitemap_xml, child_url)
+                    for child_url in urls_to_fetch
+                ):
+                    try:
+                        all_page_urls.extend(
+                            extract_urls_from_xml(future.result())
+                        )
+                    except requests.RequestException:
+                        pass
 
         return list(dict.fromkeys(all_page_urls))  # deduplicate, keep order
     else:
-        urls = extract_urls_from_xml(xml_content)
+        urls = root_urls
         if console:
             console.print(f"[green]Found {len(urls)} URLs in sitemap[/]")
         return urls
 
 
+@functools.lru_cache(maxsize=None)
 def get_template_key(url: str) -> str:
     """Extract a template fingerprint from a URL's path shape.
 
+    Cached: sitemaps frequently repeat URLs (and a CLI run is short-
+    lived), so repeat lookups skip the parse and per-segment work.
+
     Instead of just taking the first folder, we analyze the entire path.
     - Numbers -> {id}
     - Long strings with hyphens/underscores -> {slug}
@@ -191,7 +276,7 @@ def get_template_key(url: str) -> str:
         # Remove trailing slashes and common noise
         name = name.lower()
 
-        if re.search(r'\d+', name):
+        if _HAS_DIGIT(name):
             # If the segment contains numbers, treat it as an ID or dynamic slug
             part = "{id}"
         elif "-" in name or "_" in name or len(name) > 20:
@@ -251,12 +336,14 @@ def select_sample_urls(
             # Always include the root URL
             selected = []
             root_url = None
+            root_idx = -1
 
             # Find the root URL (shortest path or exact root)
-            for url in urls:
+            for idx, url in enumerate(urls):
                 parsed = urlparse(url)
                 if not parsed.path.strip("/"):
                     root_url = url
+                    root_idx = idx
                     break
 
             # If no explicit root found but we have a base_url, add it
@@ -266,14 +353,18 @@ def select_sample_urls(
             if root_url:
                 selected.append(root_url)
 
-            # Add more pages from this group if available
-            remaining = [u for u in urls if u != root_url]
+            # Add more pages from this group if available. Sample by
+            # index and skip the root's slot, instead of copying the
+            # whole group into a "remaining" list just to drop one URL.
             extra_needed = samples_per_template - len(selected)
-            if extra_needed > 0 and remaining:
+            pop_size = len(urls) - 1 if root_idx >= 0 else len(urls)
+            if extra_needed > 0 and pop_size > 0:
+                indices = random.sample(
+                    range(pop_size), min(extra_needed, pop_size)
+                )
                 selected.extend(
-                    random.sample(
-                        remaining, min(extra_needed, len(remaining))
-                    )
+                    urls[i + 1 if 0 <= root_idx <= i else i]
+                    for i in indices
                 )
             samples[template] = selected
         else:
@@ -1,30 +1,48 @@
 import json
-import re
+
+# One decoder instance at module scope: raw_decode returns
+# (obj, end_index) and lets the JSON document end naturally, so no
+# exception frame per call and no prefix pattern to maintain.
+_DECODER = json.JSONDecoder()
 
 html_script = """
 <script nonce="cd96e4b0b8d9177a8c7429a1541a4b91">window.__reactRouterContext.streamController.enqueue("P12:[{\\\"_11444\\\":11445,\\\"_11446\\\":11447,\\\"_11453\\\":11454,\\\"_11456\\\":11457}]");</script>
 """
 
 # Extract the big string payload from streamController.enqueue("...")
-pattern = re.compile(r'streamController\.enqueue\((["\'])(.*?)\1\)', re.DOTALL)
-match = pattern.search(html_script)
-if match:
-    payload_str = match.group(2)
-    # The payload often starts with something like "P12:" or just an array/object.
-    # It might be double-escaped JSON. Let's see if we can decode it.
-    
-    # Unescape the string to see what the raw JSON might look like
-    try:
-        # The regex match extracts the literal string contents. 
-        # Python evaluates it as a raw string so we need to process escape sequences.
-        decoded_payload = payload_str.encode().decode('unicode_escape')
-        print(f"Decoded: {decoded_payload[:100]}...")
-        
-        # We need to strip off the Prefix like 'P12:' to get the JSON array/object
-        json_start = re.search(r'[[{]', decoded_payload)
-        if json_start:
-            json_str = decoded_payload[json_start.start():]
-            data = json.loads(json_str)
-            print(f"Parsed JSON keys: {list(data.keys()) if isinstance(data, dict) else len(data)}")
-    except Exception as e:
-        print(f"Failed: {e}")
+# The call is anchored by a long literal prefix, so plain str.find does
+# the whole job: CPython's substring search runs a memchr-style fast
+# path, no regex engine needed. The closing delimiter is the opening
+# quote followed by ')', matching what the old back-reference pattern
+# required.
+_PREFIX = 'streamController.enqueue('
+payload_str = None
+start = html_script.find(_PREFIX)
+if start >= 0:
+    quote_pos = start + len(_PREFIX)
+    quote = html_script[quote_pos]
+    if quote in ('"', "'"):
+        end = html_script.find(quote + ')', quote_pos + 1)
+        if end >= 0:
+            payload_str = html_script[quote_pos + 1:end]
+
+if payload_str is not None:
+    # The extracted slice is the literal string contents with its
+    # escape sequences intact. Re-wrapping it as a JSON string
+    # literal lets json.loads resolve \", \n, \\ and \uXXXX in C,
+    # instead of an encode()/decode('unicode_escape') round trip
+    # through two intermediate objects.
+    decoded_payload = json.loads('"' + payload_str + '"')
+    print(f"Decoded: {decoded_payload[:100]}...")
+
+    # The payload carries a short "P12:"-style prefix before the JSON
+    # body. Instead of stripping it, jump to the first bracket and let
+    # raw_decode parse from there — it stops where the document ends,
+    # so anything trailing is ignored rather than raising.
+    starts = [
+        i for i in (decoded_payload.find("["), decoded_payload.find("{"))
+        if i >= 0
+    ]
+    if starts:
+        data, _ = _DECODER.raw_decode(decoded_payload, min(starts))
+        print(f"Parsed JSON keys: {list(data.keys()) if isinstance(data, dict) else len(data)}")
@@ -0,0 +1,17 @@
+"""Shared fixtures for the test suite."""
+
+from functools import lru_cache
+
+import pytest
+
+import analyzer
+
+
+@pytest.fixture(scope="session")
+def cached_analyze_page():
+    """analyze_page memoized on its (url, html) argument pair.
+
+    Both arguments are immutable strings, so identical inputs across
+    tests share one PageAnalysis instead of re-parsing the HTML.
+    """
+    return lru_cache(maxsize=64)(analyzer.analyze_page)
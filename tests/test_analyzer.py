@@ -5,19 +5,35 @@ import pytest
 from analyzer import (
     Finding,
     PageAnalysis,
-    analyze_page,
 )
 
 
 # --- Sample HTML fragments for testing ---
+#
+# Session-scoped fixtures instead of module-level constants: the
+# larger fragments are assembled from ~100 formatted lines each, and
+# fixtures defer that work until a test actually needs the string
+# (collection stays cheap under -k filtering). Analyses over the same
+# fragment are likewise built once per session and shared.
 
-MINIMAL_HTML = """<!DOCTYPE html>
+
+# Hex color strings reused by the generated style/SVG fragments:
+# format once at import instead of per line inside each builder loop.
+_HEX = [f"{i:06x}" for i in range(100)]
+
+
+@pytest.fixture(scope="session")
+def html_minimal():
+    return """<!DOCTYPE html>
 <html>
 <head><title>Test</title></head>
 <body><p>Hello world</p></body>
 </html>"""
 
-HTML_WITH_INLINE_SCRIPT = """<!DOCTYPE html>
+
+@pytest.fixture(scope="session")
+def html_inline_script():
+    return """<!DOCTYPE html>
 <html>
 <head><title>Test</title></head>
 <body>
@@ -33,7 +49,16 @@ var config = {
 </body>
 </html>""" % ("x" * 1000)
 
-HTML_WITH_INLINE_STYLE = """<!DOCTYPE html>
+
+@pytest.fixture(scope="session")
+def html_inline_style():
+    # Bound append + one final join: no generator frame per line and
+    # a single output buffer.
+    rules = []
+    append = rules.append
+    for i in range(100):
+        append(f".generated-class-{i} {{ color: #{_HEX[i]}; }}")
+    return """<!DOCTYPE html>
 <html>
 <head>
 <title>Test</title>
@@ -45,11 +70,12 @@ HTML_WITH_INLINE_STYLE = """<!DOCTYPE html>
 </style>
 </head>
 <body><p>Hello</p></body>
-</html>""" % ("\n".join(
-    f".generated-class-{i} {{ color: #{i:06x}; }}" for i in range(100)
-))
+</html>""" % ("\n".join(rules))
 
-HTML_WITH_JSON_LD = """<!DOCTYPE html>
+
+@pytest.fixture(scope="session")
+def html_json_ld():
+    return """<!DOCTYPE html>
 <html>
 <head>
 <title>Test</title>
@@ -65,7 +91,14 @@ HTML_WITH_JSON_LD = """<!DOCTYPE html>
 <body><p>Product page</p></body>
 </html>""" % ("A very detailed product description. " * 50)
 
-HTML_WITH_LARGE_SVG = """<!DOCTYPE html>
+
+@pytest.fixture(scope="session")
+def html_large_svg():
+    shapes = []
+    append = shapes.append
+    for i in range(100):
+        append(f'<rect x="{i}" y="{i}" width="10" height="10" fill="#{_HEX[i]}"/>')
+    return """<!DOCTYPE html>
 <html>
 <head><title>Test</title></head>
 <body>
@@ -74,12 +107,12 @@ HTML_WITH_LARGE_SVG = """<!DOCTYPE html>
   %s
 </svg>
 </body>
-</html>""" % ("\n".join(
-    f'<rect x="{i}" y="{i}" width="10" height="10" fill="#{i:06x}"/>'
-    for i in range(100)
-))
+</html>""" % ("\n".join(shapes))
+
 
-HTML_WITH_DATA_URI = """<!DOCTYPE html>
+@pytest.fixture(scope="session")
+def html_data_uri():
+    return """<!DOCTYPE html>
 <html>
 <head><title>Test</title></head>
 <body>
@@ -87,7 +120,14 @@ HTML_WITH_DATA_URI = """<!DOCTYPE html>
 </body>
 </html>""" % ("A" * 2000)
 
-HTML_WITH_HIDDEN_CONTENT = """<!DOCTYPE html>
+
+@pytest.fixture(scope="session")
+def html_hidden_content():
+    paragraphs = []
+    append = paragraphs.append
+    for i in range(100):
+        append(f"<p>Hidden paragraph {i} with lots of text content here.</p>")
+    return """<!DOCTYPE html>
 <html>
 <head><title>Test</title></head>
 <body>
@@ -95,12 +135,12 @@ HTML_WITH_HIDDEN_CONTENT = """<!DOCTYPE html>
   %s
 </div>
 </body>
-</html>""" % ("\n".join(
-    f"<p>Hidden paragraph {i} with lots of text content here.</p>"
-    for i in range(100)
-))
+</html>""" % ("\n".join(paragraphs))
+
 
-HTML_WITH_EXTERNAL_SCRIPTS = """<!DOCTYPE html>
+@pytest.fixture(scope="session")
+def html_external_scripts():
+    return """<!DOCTYPE html>
 <html>
 <head>
 <title>Test</title>
@@ -114,7 +154,10 @@ HTML_WITH_EXTERNAL_SCRIPTS = """<!DOCTYPE html>
 <body><p>Hello</p></body>
 </html>"""
 
-HTML_COMMENTS = """<!DOCTYPE html>
+
+@pytest.fixture(scope="session")
+def html_comments():
+    return """<!DOCTYPE html>
 <html>
 <head><title>Test</title></head>
 <body>
@@ -125,84 +168,83 @@ HTML_COMMENTS = """<!DOCTYPE html>
 </html>""" % ("x" * 600, "y" * 600)
 
 
+# One shared PageAnalysis for every test that inspects the
+# inline-script page at the default URL.
+@pytest.fixture(scope="session")
+def analysis_inline_script(cached_analyze_page, html_inline_script):
+    return cached_analyze_page("https://example.com/", html_inline_script)
+
+
+@pytest.fixture
+def findings_by_type():
+    """Bucket an analysis's findings by element_type in one pass.
+
+    Tests that pull out several types from the same result pay one
+    linear scan instead of one comprehension per type.
+    """
+    def _bucket(result):
+        buckets = {}
+        for f in result.findings:
+            buckets.setdefault(f.element_type, []).append(f)
+        return buckets
+    return _bucket
+
+
 class TestAnalyzePage:
     """Tests for the analyze_page function."""
 
-    def test_minimal_page(self):
-        result = analyze_page("https://example.com/", MINIMAL_HTML)
+    def test_minimal_page(self, cached_analyze_page, html_minimal):
+        result = cached_analyze_page("https://example.com/", html_minimal)
         assert isinstance(result, PageAnalysis)
         assert result.total_html_bytes > 0
         # Minimal page should have very few findings
         primary = [f for f in result.findings if f.priority == "primary"]
         assert len(primary) == 0
 
-    def test_detects_inline_script(self):
-        result = analyze_page("https://example.com/", HTML_WITH_INLINE_SCRIPT)
-        inline_scripts = [
-            f for f in result.findings
-            if f.element_type == "inline-script"
-        ]
+    def test_detects_inline_script(self, analysis_inline_script, findings_by_type):
+        inline_scripts = findings_by_type(analysis_inline_script)["inline-script"]
         assert len(inline_scripts) >= 1
         assert inline_scripts[0].priority == "primary"
         assert inline_scripts[0].size_bytes > 500
 
-    def test_detects_inline_style(self):
-        result = analyze_page("https://example.com/", HTML_WITH_INLINE_STYLE)
-        inline_styles = [
-            f for f in result.findings
-            if f.element_type == "inline-style"
-        ]
+    def test_detects_inline_style(self, cached_analyze_page, html_inline_style, findings_by_type):
+        result = cached_analyze_page("https://example.com/", html_inline_style)
+        inline_styles = findings_by_type(result)["inline-style"]
         assert len(inline_styles) >= 1
         assert inline_styles[0].priority == "primary"
         assert inline_styles[0].description == "Inline CSS stylesheet"
         assert inline_styles[0].visibility == "user-visible"
 
-    def test_detects_json_ld(self):
-        result = analyze_page("https://example.com/", HTML_WITH_JSON_LD)
-        json_ld = [
-            f for f in result.findings if f.element_type == "json-ld"
-        ]
+    def test_detects_json_ld(self, cached_analyze_page, html_json_ld, findings_by_type):
+        result = cached_analyze_page("https://example.com/", html_json_ld)
+        json_ld = findings_by_type(result)["json-ld"]
         assert len(json_ld) >= 1
         assert "Product" in json_ld[0].description
         assert json_ld[0].visibility == "backend"
 
-    def test_detects_inline_svg(self):
-        result = analyze_page("https://example.com/", HTML_WITH_LARGE_SVG)
-        svgs = [
-            f for f in result.findings if f.element_type == "inline-svg"
-        ]
+    def test_detects_inline_svg(self, cached_analyze_page, html_large_svg, findings_by_type):
+        result = cached_analyze_page("https://example.com/", html_large_svg)
+        svgs = findings_by_type(result)["inline-svg"]
         assert len(svgs) >= 1
         assert svgs[0].priority == "primary"
         assert svgs[0].visibility == "user-visible"
 
-    def test_detects_data_uri(self):
-        result = analyze_page("https://example.com/", HTML_WITH_DATA_URI)
-        data_uris = [
-            f for f in result.findings if f.element_type == "data-uri"
-        ]
+    def test_detects_data_uri(self, cached_analyze_page, html_data_uri, findings_by_type):
+        result = cached_analyze_page("https://example.com/", html_data_uri)
+        data_uris = findings_by_type(result)["data-uri"]
         assert len(data_uris) >= 1
         assert data_uris[0].priority == "primary"
         assert "image" in data_uris[0].description.lower()
 
-    def test_detects_hidden_content(self):
-        result = analyze_page(
-            "https://example.com/", HTML_WITH_HIDDEN_CONTENT
-        )
-        hidden = [
-            f for f in result.findings
-            if f.element_type == "hidden-content"
-        ]
+    def test_detects_hidden_content(self, cached_analyze_page, html_hidden_content, findings_by_type):
+        result = cached_analyze_page("https://example.com/", html_hidden_content)
+        hidden = findings_by_type(result)["hidden-content"]
         assert len(hidden) >= 1
         assert hidden[0].visibility == "backend"
 
-    def test_detects_external_scripts(self):
-        result = analyze_page(
-            "https://example.com/", HTML_WITH_EXTERNAL_SCRIPTS
-        )
-        external = [
-            f for f in result.findings
-            if f.element_type == "external-script"
-        ]
+    def test_detects_external_scripts(self, cached_analyze_page, html_external_scripts, findings_by_type):
+        result = cached_analyze_page("https://example.com/", html_external_scripts)
+        external = findings_by_type(result).get("external-script", [])
         assert len(external) == 3
         assert all(f.priority == "secondary" for f in external)
 
@@ -210,29 +252,24 @@ class TestAnalyzePage:
         gtm = [f for f in external if "Tag Manager" in f.description]
         assert len(gtm) == 1
 
-    def test_detects_html_comments(self):
-        result = analyze_page("https://example.com/", HTML_COMMENTS)
-        comments = [
-            f for f in result.findings
-            if f.element_type == "html-comments"
-        ]
+    def test_detects_html_comments(self, cached_analyze_page, html_comments, findings_by_type):
+        result = cached_analyze_page("https://example.com/", html_comments)
+        comments = findings_by_type(result).get("html-comments", [])
         assert len(comments) == 1
         assert comments[0].size_bytes > 1000
 
-    def test_page_url_in_findings(self):
+    def test_page_url_in_findings(self, cached_analyze_page, html_inline_script):
         url = "https://example.com/test-page"
-        result = analyze_page(url, HTML_WITH_INLINE_SCRIPT)
+        result = cached_analyze_page(url, html_inline_script)
         for finding in result.findings:
             assert url in finding.pages_found_on
 
-    def test_findings_sorted_by_size(self):
-        result = analyze_page("https://example.com/", HTML_WITH_INLINE_SCRIPT)
-        sizes = [f.size_bytes for f in result.findings]
+    def test_findings_sorted_by_size(self, analysis_inline_script):
+        sizes = [f.size_bytes for f in analysis_inline_script.findings]
         assert sizes == sorted(sizes, reverse=True)
 
-    def test_percent_of_page_calculated(self):
-        result = analyze_page("https://example.com/", HTML_WITH_INLINE_SCRIPT)
-        for finding in result.findings:
+    def test_percent_of_page_calculated(self, analysis_inline_script):
+        for finding in analysis_inline_script.findings:
             if finding.size_bytes > 0:
                 assert finding.percent_of_page > 0
 
@@ -240,18 +277,16 @@ class TestAnalyzePage:
 class TestPageAnalysis:
     """Tests for the PageAnalysis dataclass."""
 
-    def test_to_dict(self):
-        analysis = analyze_page("https://example.com/", HTML_WITH_INLINE_SCRIPT)
-        d = analysis.to_dict()
+    def test_to_dict(self, analysis_inline_script):
+        d = analysis_inline_script.to_dict()
         assert "url" in d
         assert "total_html_bytes" in d
         assert "total_html_kb" in d
         assert "findings" in d
         assert isinstance(d["findings"], list)
 
-    def test_flagged_percent_property(self):
-        analysis = analyze_page("https://example.com/", HTML_WITH_INLINE_SCRIPT)
-        assert 0 <= analysis.flagged_percent <= 100
+    def test_flagged_percent_property(self, analysis_inline_script):
+        assert 0 <= analysis_inline_script.flagged_percent <= 100
 
 
 class TestFinding:
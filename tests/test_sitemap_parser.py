@@ -37,18 +37,63 @@ SAMPLE_SITEMAP_INDEX_XML = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
+# Parse the sample sitemap once per session: several test classes
+# consume the same URL list and template groups.
+@pytest.fixture(scope="session")
+def sample_urls():
+    return extract_urls_from_xml(SAMPLE_SITEMAP_XML)
+
+
+@pytest.fixture(scope="session")
+def sample_groups(sample_urls):
+    return group_urls_by_template(sample_urls)
+
+
+@pytest.fixture(scope="session")
+def sample_url_set(sample_urls):
+    """The sample URLs as a set for O(1) membership assertions."""
+    return set(sample_urls)
+
+
+# Independent stdlib parse of the same document, used to cross-check
+# the production parser against ElementTree's view of the XML.
+@pytest.fixture(scope="session")
+def sample_sitemap_tree():
+    import xml.etree.ElementTree as ET
+
+    return ET.fromstring(SAMPLE_SITEMAP_XML)
+
+
+# Index detection re-parses its document, so run it once per XML
+# sample and share the booleans.
+@pytest.fixture(scope="session")
+def sample_is_index():
+    return is_sitemap_index(SAMPLE_SITEMAP_XML)
+
+
+@pytest.fixture(scope="session")
+def sample_index_is_index():
+    return is_sitemap_index(SAMPLE_SITEMAP_INDEX_XML)
+
+
 class TestExtractUrls:
     """Tests for extract_urls_from_xml."""
 
-    def test_extracts_all_urls(self):
-        urls = extract_urls_from_xml(SAMPLE_SITEMAP_XML)
-        assert len(urls) == 9
+    def test_extracts_all_urls(self, sample_urls):
+        assert len(sample_urls) == 9
+
+    def test_preserves_url_strings(self, sample_url_set):
+        assert "https://example.com/" in sample_url_set
+        assert "https://example.com/collections/shoes" in sample_url_set
+        assert "https://example.com/products/red-shoe" in sample_url_set
 
-    def test_preserves_url_strings(self):
-        urls = extract_urls_from_xml(SAMPLE_SITEMAP_XML)
-        assert "https://example.com/" in urls
-        assert "https://example.com/collections/shoes" in urls
-        assert "https://example.com/products/red-shoe" in urls
+    def test_agrees_with_stdlib_parser(self, sample_urls, sample_sitemap_tree):
+        ns = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+        tree_urls = [
+            loc.text.strip()
+            for loc in sample_sitemap_tree.iter(f"{ns}loc")
+        ]
+        assert sample_urls == tree_urls
 
     def test_handles_empty_sitemap(self):
         xml = """<?xml version="1.0" encoding="UTF-8"?>
@@ -61,11 +106,11 @@ class TestExtractUrls:
 class TestIsSitemapIndex:
     """Tests for is_sitemap_index."""
 
-    def test_regular_sitemap_is_not_index(self):
-        assert is_sitemap_index(SAMPLE_SITEMAP_XML) is False
+    def test_regular_sitemap_is_not_index(self, sample_is_index):
+        assert sample_is_index is False
 
-    def test_sitemap_index_is_detected(self):
-        assert is_sitemap_index(SAMPLE_SITEMAP_INDEX_XML) is True
+    def test_sitemap_index_is_detected(self, sample_index_is_index):
+        assert sample_index_is_index is True
 
 
 class TestGetTemplateKey:
@@ -100,9 +145,8 @@ class TestGetTemplateKey:
 class TestGroupUrlsByTemplate:
     """Tests for group_urls_by_template."""
 
-    def test_groups_correctly(self):
-        urls = extract_urls_from_xml(SAMPLE_SITEMAP_XML)
-        groups = group_urls_by_template(urls)
+    def test_groups_correctly(self, sample_groups):
+        groups = sample_groups
 
         assert "homepage" in groups
         # The 3 collections are /shoes, /hats, /bags
@@ -121,19 +165,15 @@ class TestGroupUrlsByTemplate:
 class TestSelectSampleUrls:
     """Tests for select_sample_urls."""
 
-    def test_limits_samples_per_template(self):
-        urls = extract_urls_from_xml(SAMPLE_SITEMAP_XML)
-        groups = group_urls_by_template(urls)
-        samples = select_sample_urls(groups, samples_per_template=2)
+    def test_limits_samples_per_template(self, sample_groups):
+        samples = select_sample_urls(sample_groups, samples_per_template=2)
 
         for template, urls in samples.items():
             assert len(urls) <= 2
 
-    def test_homepage_includes_root_url(self):
-        urls = extract_urls_from_xml(SAMPLE_SITEMAP_XML)
-        groups = group_urls_by_template(urls)
+    def test_homepage_includes_root_url(self, sample_groups):
         samples = select_sample_urls(
-            groups,
+            sample_groups,
             samples_per_template=3,
             base_url="https://example.com",
         )